@@ -15,9 +15,65 @@ import datetime
 import re
 import html
 import shutil
+import stat
 from pathlib import Path
 import json
-from render import Render
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from render import Render, is_binary_diff, is_oversized_diff, escape_path
+
+# Git change status letter to the status shown on review pages
+STATUS_MAP = {
+    'A': 'added',
+    'M': 'modified',
+    'D': 'deleted',
+    'R': 'renamed',
+    'C': 'copied',
+    'T': 'typechange',
+}
+
+# Escapes git uses in quoted paths, besides three-digit octal byte values
+GIT_PATH_ESCAPES = {'a': '\a', 'b': '\b', 't': '\t', 'n': '\n', 'v': '\v', 'f': '\f', 'r': '\r', '"': '"', '\\': '\\'}
+
+# Upper bound, in characters, on the git command output kept per generator
+GIT_OUTPUT_CACHE_LIMIT = 64 * 1024 * 1024
+
+def get_git_dir(repo_path):
+    """
+    Resolve the git directory for a repository.
+    
+    A .git directory, or the .git file of a worktree/submodule, is resolved
+    with a single stat; anything else, such as a bare repository, falls back
+    to `git rev-parse --git-dir`.
+    
+    Args:
+        repo_path (str): Path to the repository
+        
+    Returns:
+        str or None: Path to the git directory, or None if not a Git repository
+    """
+    # A .git directory, or a .git file pointing at one, answers without running git
+    dot_git = os.path.join(repo_path, '.git')
+    try:
+        st = os.stat(dot_git)
+    except OSError:
+        st = None
+    if st is not None and stat.S_ISDIR(st.st_mode):
+        return os.path.normpath(dot_git)
+    if st is not None and stat.S_ISREG(st.st_mode):
+        with open(dot_git, 'r', encoding='utf-8', errors='replace') as f:
+            pointer = f.readline().strip()
+        if pointer.startswith('gitdir:'):
+            git_dir = os.path.normpath(os.path.join(repo_path, pointer[len('gitdir:'):].strip()))
+            if os.path.isdir(git_dir):
+                return git_dir
+    
+    try:
+        result = subprocess.run(['git', '-C', repo_path, 'rev-parse', '--git-dir'],
+                                check=True, capture_output=True, text=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return os.path.normpath(os.path.join(repo_path, result.stdout.strip()))
 
 def is_git_or_svn(repo_path):
     """
@@ -31,8 +87,8 @@ def is_git_or_svn(repo_path):
     """
     repo_path = os.path.abspath(repo_path)
     
-    # Check for Git repository
-    if os.path.isdir(os.path.join(repo_path, '.git')):
+    # Check for Git repository (.git is a file for worktrees and submodules)
+    if os.path.exists(os.path.join(repo_path, '.git')):
         return 'git'
     
     # Check for SVN repository by looking for .svn directory
@@ -54,16 +110,68 @@ def is_git_or_svn(repo_path):
     except (subprocess.CalledProcessError, FileNotFoundError):
         pass
     
-    # Try running git status to see if it's a Git repository
-    try:
-        subprocess.run(['git', 'status'], cwd=repo_path, check=True, 
-                      capture_output=True, text=True)
+    # Ask git itself, which also recognizes bare repositories
+    if get_git_dir(repo_path):
         return 'git'
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
     
     return 'unknown'
 
+def unquote_git_path(path):
+    """
+    Undo the C-style quoting git applies to unusual paths in diff headers.
+    
+    Args:
+        path (str): A path as printed by git, quoted or not
+        
+    Returns:
+        str: The path itself
+    """
+    if not path.startswith('"'):
+        return path
+    
+    out = bytearray()
+    inner = path[1:-1]
+    i = 0
+    while i < len(inner):
+        c = inner[i]
+        if c == '\\' and i + 1 < len(inner):
+            escaped = inner[i + 1]
+            if escaped in '01234567':
+                out.append(int(inner[i + 1:i + 4], 8))
+                i += 4
+                continue
+            out += GIT_PATH_ESCAPES.get(escaped, escaped).encode('utf-8')
+            i += 2
+            continue
+        out += c.encode('utf-8')
+        i += 1
+    return out.decode('utf-8', errors='replace')
+
+def get_diff_chunk_path(chunk):
+    """
+    Get the new-side path of one `diff --git` section of a patch.
+    
+    Args:
+        chunk (str): The section, starting with its `diff --git a/... b/...` line
+        
+    Returns:
+        str: Path of the file the section belongs to
+    """
+    header, _, extended = chunk.partition('\n')
+    # Renames and copies name the new path on a line of its own
+    for line in extended.split('\n'):
+        if line.startswith(('@@', '--- ', 'Binary files ')):
+            break
+        if line.startswith('rename to '):
+            return unquote_git_path(line[len('rename to '):])
+        if line.startswith('copy to '):
+            return unquote_git_path(line[len('copy to '):])
+    
+    # Otherwise both sides name the same path, so the header is "a/P b/P"
+    # with each half quoted the same way; the second half is the b/ path
+    paths = header[len('diff --git '):]
+    return unquote_git_path(paths[(len(paths) + 1) // 2:]).partition('/')[2]
+
 
 class GitCommitReviewGenerator:
     """
@@ -88,6 +196,19 @@ class GitCommitReviewGenerator:
         self.template_dir = template_dir
         self.scan_results_dir = scan_results_dir
         
+        # Commit info already fetched during this run, keyed by commit hash
+        self._commit_info_cache = {}
+        
+        # (commit info, per-file diffs) parsed from each commit's git show
+        self._commit_bundle_cache = {}
+        
+        # Long-lived `git cat-file --batch` process, started on first use
+        self._cat_file_proc = None
+        
+        # Output of git commands already run, most recently used last
+        self._git_output_cache = OrderedDict()
+        self._git_output_cache_size = 0
+        
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
         
@@ -99,7 +220,7 @@ class GitCommitReviewGenerator:
         self.renderer = Render(self.output_dir, self.assets_dir)
         
         # Verify git repository
-        if not os.path.isdir(os.path.join(self.repo_path, '.git')):
+        if not get_git_dir(self.repo_path):
             raise ValueError(f"Not a valid Git repository: {self.repo_path}")
     
     def load_scan_results(self):
@@ -252,16 +373,25 @@ class GitCommitReviewGenerator:
         
         return scan_results
     
-    def run_git_command(self, command):
+    def run_git_command(self, command, input=None, cache=True):
         """
         Run a git command and return the output.
         
         Args:
             command (list): Git command as a list of arguments
+            input (str, optional): Text to feed to the command's stdin
+            cache (bool): Keep the output for identical later calls; callers that
+                cache a parsed form of the output themselves pass False
             
         Returns:
             str: Command output
         """
+        key = (tuple(command), input)
+        cached = self._git_output_cache.get(key) if cache else None
+        if cached is not None:
+            self._git_output_cache.move_to_end(key)
+            return cached
+        
         try:
             # add debug log to print the command
             print(f"Running git command: {' '.join(command)}")
@@ -272,205 +402,211 @@ class GitCommitReviewGenerator:
                 capture_output=True,
                 text=True,
                 encoding='utf-8',
-                errors='replace'
+                errors='replace',
+                input=input
             )
-            return result.stdout.strip()
+            output = result.stdout.strip()
         except subprocess.CalledProcessError as e:
             print(f"Error running git command: {e}")
             print(f"Error output: {e.stderr}")
             sys.exit(1)
+        
+        if not cache:
+            return output
+        
+        # The repository does not change during a run, so outputs stay valid;
+        # evict the least recently used ones once the cache grows too large
+        self._git_output_cache[key] = output
+        self._git_output_cache_size += len(output)
+        while self._git_output_cache_size > GIT_OUTPUT_CACHE_LIMIT and len(self._git_output_cache) > 1:
+            _, evicted = self._git_output_cache.popitem(last=False)
+            self._git_output_cache_size -= len(evicted)
+        return output
     
-    def get_commit_info(self, commit_hash):
+    def get_many_commit_infos(self, commit_hashes):
         """
-        Get detailed information about a specific commit.
+        Get information about several commits with a single git log call.
+        
+        The hashes are fed to `git log --no-walk --stdin`, and commits already
+        in the cache are not asked for again.
         
         Args:
-            commit_hash (str): The commit hash to get information for
+            commit_hashes (list): The commit hashes to get information for
             
         Returns:
-            dict: Commit information
+            dict: Commit information keyed by the requested commit hash
         """
-        # Get basic commit info
-        format_str = '%H%n%an%n%ae%n%at%n%s%n%b'
-        commit_data = self.run_git_command(['show', '--no-patch', f'--format={format_str}', commit_hash])
-        
-        lines = commit_data.split('\n')
-        commit_timestamp = int(lines[3])
+        missing = [h for h in dict.fromkeys(commit_hashes) if h not in self._commit_info_cache]
+        if missing:
+            # Records end with RS (0x1e) and fields are separated by NUL, which,
+            # unlike US, is not stripped as whitespace when the body is empty
+            format_str = '%H%x00%an%x00%ae%x00%at%x00%P%x00%s%x00%b%x1e'
+            output = self.run_git_command(
+                ['log', '--no-walk=unsorted', '--stdin', f'--format={format_str}'],
+                input='\n'.join(missing) + '\n'
+            )
+            records = [r.lstrip('\n') for r in output.split('\x1e')]
+            
+            # --no-walk=unsorted keeps the commits in the order they were given
+            for commit_hash, record in zip(missing, records):
+                fields = record.split('\x00')
+                commit_timestamp = int(fields[3])
+                commit_date = datetime.datetime.fromtimestamp(commit_timestamp)
+                parents = fields[4].split()
+                
+                self._commit_info_cache[commit_hash] = {
+                    'hash': fields[0],
+                    'author_name': fields[1],
+                    'author_email': fields[2],
+                    'timestamp': commit_timestamp,
+                    'date': commit_date.strftime('%Y-%m-%d %H:%M:%S'),
+                    'subject': fields[5],
+                    'body': fields[6].rstrip(),
+                    'files_changed': [],
+                    'parent_hash': parents[0] if parents else '',
+                }
+        
+        return {h: self._commit_info_cache[h] for h in commit_hashes}
+    
+    def get_commit_bundle(self, commit_hash):
+        """
+        Get commit information, changed files and per-file diffs with a single
+        `git show` invocation instead of one git process per file.
+
+        Args:
+            commit_hash (str): The commit hash
+
+        Returns:
+            tuple: (commit_info dict with 'files_changed' populated,
+                    dict mapping filename to its diff text)
+        """
+        cached = self._commit_bundle_cache.get(commit_hash)
+        if cached is not None:
+            return cached
+        
+        # Metadata fields are NUL separated and terminated by a sentinel, then
+        # git emits the --raw file list followed by the full patch. With -z the
+        # raw entries are NUL separated and their paths are never quoted; the
+        # prefixes are fixed so user diff settings cannot change the headers.
+        format_str = '%H%x00%an%x00%ae%x00%at%x00%P%x00%s%x00%b%x00--END-META--'
+        output = self.run_git_command([
+            'show', f'--format={format_str}', '--raw', '-z', '--no-abbrev', '--patch',
+            '-M', '-C', '--first-parent', '-m', '--no-color',
+            '--src-prefix=a/', '--dst-prefix=b/', commit_hash
+        ], cache=False)
+
+        meta, _, rest = output.partition('\x00--END-META--')
+        fields = meta.split('\x00')
+        commit_timestamp = int(fields[3])
         commit_date = datetime.datetime.fromtimestamp(commit_timestamp)
-        
+        parents = fields[4].split()
+
         commit_info = {
-            'hash': lines[0],
-            'author_name': lines[1],
-            'author_email': lines[2],
+            'hash': fields[0],
+            'author_name': fields[1],
+            'author_email': fields[2],
             'timestamp': commit_timestamp,
             'date': commit_date.strftime('%Y-%m-%d %H:%M:%S'),
-            'subject': lines[4],
-            'body': '\n'.join(lines[5:]) if len(lines) > 5 else '',
+            'subject': fields[5],
+            'body': fields[6].rstrip(),
             'files_changed': [],
+            'parent_hash': parents[0] if parents else '',
         }
+
+        # Raw entries come first, each ":<modes> <shas> <status>" followed by
+        # its path, or by the old and the new path for renames and copies
+        rest = rest.lstrip('\x00\n')
+        pos = 0
+        while rest.startswith(':', pos):
+            end = rest.index('\x00', pos)
+            raw_fields = rest[pos:end].split(' ')
+            status = raw_fields[-1]
+            pos = end + 1
+            for _ in range(2 if status[0] in 'RC' else 1):
+                end = rest.index('\x00', pos)
+                filename = rest[pos:end]
+                pos = end + 1
+            commit_info['files_changed'].append({
+                'status': STATUS_MAP.get(status[0], 'unknown'),
+                'filename': filename,
+                'blob': raw_fields[3]
+            })
         
-        # Get parent commit hash
-        parent_hash = self.run_git_command(['rev-parse', f'{commit_hash}^'])
-        commit_info['parent_hash'] = parent_hash
-        
-        return commit_info
-    
-    def get_changed_files(self, commit_hash):
+        # The patch is cut at its headers, and each section is keyed by the path
+        # it names, since a typechange emits a deletion and an addition section
+        # for a single raw entry
+        file_diffs = {}
+        patch = rest[pos:].lstrip('\x00\n')
+        if patch:
+            diff_chunks = patch.split('\ndiff --git ')
+            diff_chunks[1:] = ['diff --git ' + chunk for chunk in diff_chunks[1:]]
+            for chunk in diff_chunks:
+                chunk = chunk.rstrip('\n')
+                filename = get_diff_chunk_path(chunk)
+                # Of a typechange's two sections, keep the one showing the new content
+                if filename not in file_diffs or '\ndeleted file mode ' not in chunk.partition('\n@@')[0]:
+                    file_diffs[filename] = chunk
+
+        self._commit_info_cache[commit_hash] = commit_info
+        self._commit_bundle_cache[commit_hash] = (commit_info, file_diffs)
+        return commit_info, file_diffs
+
+    def read_blobs(self, blob_ids):
         """
-        Get list of files changed in the commit.
+        Read file contents through one `git cat-file --batch` pipe.
+        
+        The process is started on first use and reused for every later call,
+        so no git process is spawned per file. Objects are requested by id rather
+        than by "<commit>:<path>", since a path may contain a newline, which would
+        turn one request into two and leave the pipe out of step.
         
         Args:
-            commit_hash (str): The commit hash
+            blob_ids (dict): Filename to the object id of its content, as listed by --raw
             
         Returns:
-            list: List of changed files with their status
+            dict: Filename to decoded content, or None if the object is not a readable blob
         """
-        files_data = self.run_git_command(['diff-tree', '--no-commit-id', '--name-status', '-r', commit_hash])
-        
-        files = []
-        for line in files_data.split('\n'):
-            if not line.strip():
-                continue
-                
-            parts = line.split('\t')
-            status = parts[0]
-            filename = parts[1] if len(parts) > 1 else ""
-            
-            status_map = {
-                'A': 'added',
-                'M': 'modified',
-                'D': 'deleted',
-                'R': 'renamed',
-                'C': 'copied',
-            }
-            
-            status_text = status_map.get(status[0], 'unknown')
-            
-            files.append({
-                'status': status_text,
-                'filename': filename
-            })
-            
-        return files
-    
-    def get_file_diff(self, commit_hash, filename):
-        """
-        Get the diff for a specific file in the commit.
+        if self._cat_file_proc is None:
+            self._cat_file_proc = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE
+            )
+        proc = self._cat_file_proc
         
-        Args:
-            commit_hash (str): The commit hash
-            filename (str): The filename to get diff for
+        blobs = {}
+        for filename, blob_id in blob_ids.items():
+            proc.stdin.write(f"{blob_id}\n".encode('ascii'))
+            proc.stdin.flush()
             
-        Returns:
-            str: The file diff
-        """
-        try:
-            diff = self.run_git_command(['diff', f'{commit_hash}^', commit_hash, '--', filename])
-            return diff
-        except Exception as e:
-            print(f"Error getting diff for {filename}: {e}")
-            return ""
+            # Reply is "<sha> <type> <size>\n<content>\n", or "<object> missing\n"
+            line = proc.stdout.readline()
+            if line.endswith(b' missing\n'):
+                blobs[filename] = None
+                continue
+            header = line.split()
+            if header[1] != b'blob':
+                proc.stdout.read(int(header[2]) + 1)
+                blobs[filename] = None
+                continue
+            content = proc.stdout.read(int(header[2]))
+            proc.stdout.read(1)
+            blobs[filename] = content.decode('utf-8', errors='replace')
+        return blobs
     
-    def parse_diff_to_html(self, diff_text):
+    def close(self):
         """
-        Parse git diff output to HTML with syntax highlighting.
+        Stop the `git cat-file --batch` process started by read_blobs, if any.
         
-        Args:
-            diff_text (str): Git diff output
-            
-        Returns:
-            str: HTML representation of the diff
+        The generator stays usable; a later read_blobs starts a new process.
         """
-        if not diff_text:
-            return "<div class='diff-empty'>No changes</div>"
-            
-        html_lines = []
-        
-        # Process the diff header
-        lines = diff_text.split('\n')
-        in_header = True
-        header_lines = []
-        
-        # Track line numbers
-        old_line_num = 0
-        new_line_num = 0
-        
-        for i, line in enumerate(lines):
-            if in_header and line.startswith('@@'):
-                in_header = False
-                # Parse the hunk header to get starting line numbers
-                match = re.match(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@', line)
-                if match:
-                    old_line_num = int(match.group(1))
-                    new_line_num = int(match.group(3))
-                
-                # Add header
-                if header_lines:
-                    html_lines.append("<div class='diff-header'>")
-                    for header_line in header_lines:
-                        html_lines.append(f"<div>{html.escape(header_line)}</div>")
-                    html_lines.append("</div>")
-                
-                # Start diff content
-                html_lines.append("<div class='diff-content'>")
-                html_lines.append("<table class='diff-table'>")
-            
-            if in_header:
-                header_lines.append(line)
-                continue
-                
-            # Process diff content
-            if line.startswith('@@'):
-                # Diff hunk header
-                html_lines.append("<tr class='diff-hunk-header'>")
-                html_lines.append(f"<td colspan='4'>{html.escape(line)}</td>")
-                html_lines.append("</tr>")
-            elif line.startswith('+'):
-                # Added line
-                html_lines.append("<tr class='diff-added'>")
-                html_lines.append("<td class='diff-sign'>+</td>")
-                html_lines.append("<td class='diff-line-num'></td>")
-                html_lines.append(f"<td class='diff-line-num'>{new_line_num}</td>")
-                html_lines.append(f"<td class='diff-line-content'>{html.escape(line[1:])}</td>")
-                html_lines.append("</tr>")
-                new_line_num += 1
-            elif line.startswith('-'):
-                # Removed line
-                html_lines.append("<tr class='diff-removed'>")
-                html_lines.append("<td class='diff-sign'>-</td>")
-                html_lines.append(f"<td class='diff-line-num'>{old_line_num}</td>")
-                html_lines.append("<td class='diff-line-num'></td>")
-                html_lines.append(f"<td class='diff-line-content'>{html.escape(line[1:])}</td>")
-                html_lines.append("</tr>")
-            elif line.startswith(' '):
-                # Context line
-                html_lines.append("<tr class='diff-context'>")
-                html_lines.append("<td class='diff-sign'>&nbsp;</td>")
-                html_lines.append(f"<td class='diff-line-num'>{old_line_num}</td>")
-                html_lines.append(f"<td class='diff-line-num'>{new_line_num}</td>")
-                html_lines.append(f"<td class='diff-line-content'>{html.escape(line[1:])}</td>")
-                html_lines.append("</tr>")
-                old_line_num += 1
-                new_line_num += 1
-            else:
-                # Other lines
-                html_lines.append("<tr>")
-                html_lines.append("<td class='diff-sign'>&nbsp;</td>")
-                html_lines.append("<td class='diff-line-num'></td>")
-                html_lines.append("<td class='diff-line-num'></td>")
-                html_lines.append(f"<td class='diff-line-content'>{html.escape(line)}</td>")
-                html_lines.append("</tr>")
-        
-        if not in_header:
-            html_lines.append("</table>")
-            html_lines.append("</div>")
-        
-        return "\n".join(html_lines)
-    
-
-    
-
-
+        proc = self._cat_file_proc
+        if proc is not None:
+            self._cat_file_proc = None
+            proc.stdin.close()
+            proc.wait()
+            proc.stdout.close()
     
     def generate_review_page(self, commit_hash):
         """
@@ -482,54 +618,65 @@ class GitCommitReviewGenerator:
         Returns:
             str: Path to the generated HTML file
         """
-        # Get commit information
-        commit_info = self.get_commit_info(commit_hash)
-        
-        # Get changed files
-        commit_info['files_changed'] = self.get_changed_files(commit_hash)
-        
+        # Get commit information, changed files and all diffs in one git call
+        commit_info, file_diffs = self.get_commit_bundle(commit_hash)
+
         # Build file tree
         file_tree = self.renderer._build_file_tree(commit_info['files_changed'])
         
-        # Preload new file contents for dynamic context
+        # Preload new file contents at this commit for dynamic context;
+        # deleted files have no blob, and binary and oversized diffs are collapsed
+        # to a note, so none of those are read
+        filenames = [file_info['filename'] for file_info in commit_info['files_changed']]
+        text_blob_ids = {file_info['filename']: file_info['blob'] for file_info in commit_info['files_changed']
+                         if file_info['status'] != 'deleted'
+                         and not is_binary_diff(file_diffs.get(file_info['filename'], ""))
+                         and not is_oversized_diff(file_diffs.get(file_info['filename'], ""))}
+        blobs = self.read_blobs(text_blob_ids)
         new_file_contents = {}
-        for file_info in commit_info['files_changed']:
-            filename = file_info['filename']
-            try:
-                with open(os.path.join(self.repo_path, filename), 'r', encoding='utf-8', errors='replace') as f:
-                    new_file_contents[filename] = f.read().splitlines()
-            except Exception:
+        read_filenames = set()
+        for filename in filenames:
+            # Pop each blob so its raw text can be freed once it is split into lines
+            content = blobs.pop(filename, None)
+            if content is not None:
+                read_filenames.add(filename)
+                new_file_contents[filename] = content.splitlines()
+            else:
                 new_file_contents[filename] = []
+        del blobs
 
         # Load scan results from directory
         scan_results = self.load_scan_results()
 
-        # Generate diff HTMLs for each file
-        diff_htmls = []
-        for i, file_info in enumerate(commit_info['files_changed']):
-            filename = file_info['filename']
-            diff_text = self.get_file_diff(commit_hash, filename)
-            diff_html, _ = self.renderer.parse_diff_to_html_with_expand(diff_text, filename, i, scan_results, self.repo_path)
-            diff_htmls.append(f'''
+        # Generate diff HTMLs for each file lazily, as the page is written
+        def iter_diff_htmls():
+            for i, file_info in enumerate(commit_info['files_changed']):
+                filename = file_info['filename']
+                diff_text = file_diffs.get(filename, "")
+                if file_info['status'] == 'deleted':
+                    # Nothing is left to review line by line, and the file cannot be read
+                    diff_html = self.renderer.render_deleted_file(diff_text)
+                else:
+                    full_lines = new_file_contents[filename] if filename in read_filenames else None
+                    diff_html, _ = self.renderer.parse_diff_to_html_with_expand(diff_text, filename, i, scan_results, self.repo_path, full_lines)
+                yield f'''
                 <div class="diff-header">
-                    <div>{html.escape(filename)}</div>
+                    <div>{escape_path(filename)}</div>
                 </div>
                 {diff_html}
-            ''')
-
-        # Generate HTML using common renderer
-        html_content = self.renderer.generate_review_page(
-            commit_info,
-            file_tree,
-            scan_results,
-            new_file_contents,
-            diff_htmls
-        )
+            '''
 
-        # Write HTML to file
+        # Stream HTML to file using common renderer
         output_file = os.path.join(self.output_dir, f"review-{commit_hash[:7]}.html")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            self.renderer.generate_review_page(
+                f,
+                commit_info,
+                file_tree,
+                scan_results,
+                new_file_contents,
+                iter_diff_htmls()
+            )
         return output_file
     
 
@@ -545,46 +692,13 @@ class GitCommitReviewGenerator:
         Returns:
             str: Path to the generated index HTML file
         """
-        html_content = """<!DOCTYPE html>
+        parts = ["""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Git Commit Reviews</title>
     <link rel="stylesheet" href="assets/style.css">
-    <style>
-        .commit-list {
-            background-color: #fff;
-            border: 1px solid #e1e4e8;
-            border-radius: 3px;
-            margin-bottom: 20px;
-        }
-        
-        .commit-item {
-            padding: 16px;
-            border-bottom: 1px solid #e1e4e8;
-        }
-        
-        .commit-item:last-child {
-            border-bottom: none;
-        }
-        
-        .commit-title {
-            font-weight: 600;
-            margin-bottom: 8px;
-        }
-        
-        .commit-meta {
-            color: #586069;
-            font-size: 12px;
-            display: flex;
-            flex-wrap: wrap;
-        }
-        
-        .commit-meta-item {
-            margin-right: 16px;
-        }
-    </style>
 </head>
 <body>
     <div class="header">
@@ -592,19 +706,21 @@ class GitCommitReviewGenerator:
     </div>
     
     <div class="commit-list">
-"""
+"""]
         
+        html_escape = html.escape
+        commit_infos = self.get_many_commit_infos(commit_hashes)
         for commit_hash in commit_hashes:
-            commit_info = self.get_commit_info(commit_hash)
+            commit_info = commit_infos[commit_hash]
             
-            html_content += f"""
+            parts.append(f"""
         <div class="commit-item">
             <div class="commit-title">
-                <a href="review-{commit_hash[:7]}.html">{html.escape(commit_info['subject'])}</a>
+                <a href="review-{commit_hash[:7]}.html">{html_escape(commit_info['subject'])}</a>
             </div>
             <div class="commit-meta">
                 <div class="commit-meta-item">
-                    <strong>Author:</strong> {html.escape(commit_info['author_name'])}
+                    <strong>Author:</strong> {html_escape(commit_info['author_name'])}
                 </div>
                 <div class="commit-meta-item">
                     <strong>Date:</strong> {commit_info['date']}
@@ -614,9 +730,9 @@ class GitCommitReviewGenerator:
                 </div>
             </div>
         </div>
-"""
+""")
         
-        html_content += """
+        parts.append("""
     </div>
     
     <div class="footer">
@@ -624,12 +740,12 @@ class GitCommitReviewGenerator:
     </div>
 </body>
 </html>
-"""
+""")
         
         # Write HTML to file
         output_file = os.path.join(self.output_dir, "index.html")
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write("".join(parts))
             
         return output_file
     
@@ -652,9 +768,24 @@ class GitCommitReviewGenerator:
         
         generated_files = []
         
-        # Generate review page for each commit
-        for commit_hash in commit_hashes:
-            output_file = self.generate_review_page(commit_hash)
+        # Shared assets are written once, not once per commit
+        self.renderer.generate_css()
+        self.renderer.generate_js()
+        
+        # Commits are independent, so render them in parallel processes
+        if len(commit_hashes) > 1:
+            worker_args = (self.repo_path, self.output_dir, None, self.template_dir, self.scan_results_dir)
+            max_workers = min(len(commit_hashes), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_review_worker,
+                                     initargs=worker_args) as executor:
+                output_files = list(executor.map(_generate_review_page_in_worker, commit_hashes))
+        else:
+            try:
+                output_files = [self.generate_review_page(commit_hash) for commit_hash in commit_hashes]
+            finally:
+                self.close()
+        
+        for commit_hash, output_file in zip(commit_hashes, output_files):
             generated_files.append(output_file)
             print(f"Generated review page for commit {commit_hash[:7]}: {output_file}")
         
@@ -666,6 +797,24 @@ class GitCommitReviewGenerator:
         return generated_files
 
 
+# Generator owned by each worker process of the review page pool
+_worker_generator = None
+
+def _init_review_worker(*generator_args):
+    """Create the per-process generator used by _generate_review_page_in_worker."""
+    global _worker_generator
+    _worker_generator = GitCommitReviewGenerator(*generator_args)
+
+def _generate_review_page_in_worker(commit_hash):
+    """Generate one review page inside a worker process."""
+    # Pool workers are ended without running cleanup, so the cat-file
+    # process is stopped after each page rather than left behind
+    try:
+        return _worker_generator.generate_review_page(commit_hash)
+    finally:
+        _worker_generator.close()
+
+
 def main():
     """Main function to parse arguments and run the generator."""
     parser = argparse.ArgumentParser(description='Generate static HTML pages for Git/SVN commit/revision reviews')
@@ -8,166 +8,64 @@ Git and SVN review page generators.
 
 import os
 import html
+import functools
+import hashlib
 import json
 import re
 
 
-class Render:
-    """
-    A class to handle common rendering functionality for review pages.
+# Unified diff hunk header, e.g. "@@ -12,7 +12,8 @@"
+HUNK_HEADER_RE = re.compile(r'^@@ -(?P<old_start>\d+)(?:,(?P<old_count>\d+))? \+(?P<new_start>\d+)(?:,(?P<new_count>\d+))? @@')
+
+# Row templates for diff tables, filled with % formatting in the hot loops
+ROW_HUNK_HEADER = "<tr class='diff-hunk-header'><td colspan='4'>%s</td></tr>"
+ROW_ADDED = "<tr class='diff-added'><td class='diff-sign'>+</td><td class='diff-line-num'></td><td class='diff-line-num'>%s</td><td class='diff-line-content'>%s</td></tr>"
+ROW_REMOVED = "<tr class='diff-removed'><td class='diff-sign'>-</td><td class='diff-line-num'>%s</td><td class='diff-line-num'></td><td class='diff-line-content'>%s</td></tr>"
+ROW_CONTEXT = "<tr class='diff-context'><td class='diff-sign'>&nbsp;</td><td class='diff-line-num'>%s</td><td class='diff-line-num'>%s</td><td class='diff-line-content'>%s</td></tr>"
+ROW_NEW_CONTEXT = "<tr class='diff-context'><td class='diff-sign'>&nbsp;</td><td class='diff-line-num'></td><td class='diff-line-num'>%s</td><td class='diff-line-content'>%s</td></tr>"
+ROW_OTHER = "<tr><td class='diff-sign'>&nbsp;</td><td class='diff-line-num'></td><td class='diff-line-num'></td><td class='diff-line-content'>%s</td></tr>"
+
+# Line git and svn print in place of hunks for binary files
+BINARY_DIFF_RE = re.compile(r'^(?:Binary files .* differ|Cannot display: file marked as a binary type\.)$', re.MULTILINE)
+
+# Diffs with more lines than this are collapsed instead of rendered
+MAX_DIFF_LINES = 20000
+
+
+def is_binary_diff(diff_text):
     """
+    Check whether a single-file diff is for a binary file.
     
-    def __init__(self, output_dir, assets_dir):
-        """
-        Initialize the renderer with output directories.
-        
-        Args:
-            output_dir (str): Directory to output the generated HTML files
-            assets_dir (str): Directory for CSS/JS assets
-        """
-        self.output_dir = output_dir
-        self.assets_dir = assets_dir
-    
-    def _normalize_path_for_matching(self, file_path):
-        """
-        Normalize file paths for matching between scan results and SVN paths.
-        
-        Args:
-            file_path (str): The file path to normalize
-            
-        Returns:
-            str: Normalized path for matching
-        """
-        # Convert to forward slashes
-        normalized = file_path.replace('\\', '/')
-        
-        # Remove drive letters and common prefixes
-        prefixes_to_remove = [
-            r'^[A-Za-z]:/[^/]+/',  # Remove drive + first directory (e.g., "D:/serverdev/")
-            r'^[A-Za-z]:\\[^\\]+\\',  # Remove drive + first directory (Windows style)
-            r'^src/',  # Remove src/ prefix
-            r'^trunk/',  # Remove trunk/ prefix
-        ]
-        
-        for prefix_pattern in prefixes_to_remove:
-            normalized = re.sub(prefix_pattern, '', normalized, flags=re.IGNORECASE)
-        
-        return normalized.lower()
-    
-    def _convert_urls_to_links(self, text):
-        """
-        Convert https URLs in text to clickable HTML links.
-        
-        Args:
-            text (str): Text that may contain https URLs
-            
-        Returns:
-            str: Text with URLs converted to HTML links
-        """
-        # First escape HTML to prevent XSS
-        escaped_text = html.escape(text)
-        
-        # URL pattern to match https links
-        url_pattern = r'https://[^\s<>"\']*'
-        
-        def replace_url(match):
-            url = match.group(0)
-            return f'<a href="{url}" target="_blank">{url}</a>'
-        
-        # Replace URLs with links
-        return re.sub(url_pattern, replace_url, escaped_text)
-    
-    def _find_matching_scan_result(self, scan_results, filename, line_num):
-        """
-        Find scan result that matches the given filename and line number.
-        Uses both exact matching and normalized path matching.
-        
-        Args:
-            scan_results (list): List of scan results
-            filename (str): The filename to match
-            line_num (int): The line number to match
-            
-        Returns:
-            dict or None: Matching scan result or None if not found
-        """
-        line_str = str(line_num)
+    Args:
+        diff_text (str): The diff text of one file
         
-        # First try exact filename match
-        exact_match = next((r for r in scan_results 
-                           if str(r['行号']) == line_str and r['文件名'] == filename), None)
-        if exact_match:
-            return exact_match
-        
-        # Try normalized path matching
-        normalized_target = self._normalize_path_for_matching(filename)
-        
-        for result in scan_results:
-            if str(result['行号']) == line_str:
-                normalized_scan_path = self._normalize_path_for_matching(result['文件名'])
-                if normalized_scan_path == normalized_target:
-                    return result
-                
-                # Also try basename matching as fallback
-                if os.path.basename(result['文件名']) == os.path.basename(filename):
-                    return result
-        
-        # Try custom path mappings (add your specific mappings here)
-        custom_mappings = {
-            # Example: Map scan result path to SVN path
-            # 'D:\\serverdev\\Server\\MatchServer\\MatchManager.cpp': 'src/Server/AllPlayerTeamMatchServer/AllPlayerTeamMatchCourse.cpp',
-        }
-        
-        # Check if SVN filename has a mapping to a scan result path
-        for scan_path, svn_path in custom_mappings.items():
-            if svn_path == filename:
-                for result in scan_results:
-                    if str(result['行号']) == line_str and result['文件名'] == scan_path:
-                        return result
-        
-        return None
-    
-    def _build_file_tree(self, files_changed):
-        """
-        Build a nested dictionary representing the folder/file tree from a flat file list.
-        """
-        tree = {}
-        for idx, file_info in enumerate(files_changed):
-            parts = file_info['filename'].split('/')
-            node = tree
-            for part in parts[:-1]:
-                node = node.setdefault(part, {})
-            node[parts[-1]] = {'__file__': file_info, '__index__': idx}
-        return tree
+    Returns:
+        bool: True if the diff reports a binary change instead of hunks
+    """
+    # Only the header, before the first hunk, can hold the binary marker
+    header_end = diff_text.find('\n@@')
+    if header_end == -1:
+        header_end = len(diff_text)
+    return BINARY_DIFF_RE.search(diff_text, 0, header_end) is not None
 
-    def _render_file_tree(self, tree, parent_path="", level=0):
-        """
-        Recursively render the file tree as nested <ul>/<li> HTML.
-        """
-        html_out = '<ul class="file-tree' + (" root" if level == 0 else "") + '">'
-        for name, value in sorted(tree.items()):
-            if isinstance(value, dict) and '__file__' in value:
-                file_info = value['__file__']
-                idx = value['__index__']
-                status_class = file_info['status']
-                status_text = file_info['status'].capitalize()
-                base_name = os.path.basename(file_info["filename"])
-                html_out += f'<li class="file-leaf"><div class="file-item" data-diff-id="diff-{idx}"><span class="file-status {status_class}">{status_text}</span><span class="file-name">{html.escape(base_name)}</span></div></li>'
-            else:
-                folder_id = f"folder-{parent_path.replace('/', '-')}-{name}".replace(' ', '-')
-                html_out += f'<li class="file-folder" data-folder="{html.escape(name)}"><div class="folder-label" data-folder-id="{folder_id}"><span class="folder-caret">▶</span><span class="folder-name">{html.escape(name)}</span></div>'
-                html_out += self._render_file_tree(value, parent_path + name + '/', level+1)
-                html_out += '</li>'
-        html_out += '</ul>'
-        return html_out
+def is_oversized_diff(diff_text):
+    """
+    Check whether a single-file diff is too long to render line by line.
     
-    def generate_css(self):
-        """
-        Generate CSS for the review page.
+    Args:
+        diff_text (str): The diff text of one file
         
-        Returns:
-            str: Path to the generated CSS file
-        """
-        css_content = """
+    Returns:
+        bool: True if the diff has more than MAX_DIFF_LINES lines
+    """
+    return diff_text.count('\n') >= MAX_DIFF_LINES
+
+# Paths repeat across files and commits, so their escaped form is cached.
+# Unbounded inputs such as diff line content must keep using html.escape.
+escape_path = functools.lru_cache(maxsize=4096)(html.escape)
+
+# Stylesheet and script shared by all review pages, encoded once at import
+_CSS_CONTENT = """
         /* Reset and base styles */
         * {
             box-sizing: border-box;
@@ -702,29 +600,37 @@ class Render:
             background-color: #f6f8fa;
             border-bottom: 1px solid #e1e4e8;
         }
-        """
-        
-        css_path = os.path.join(self.assets_dir, 'style.css')
-        with open(css_path, 'w', encoding='utf-8') as f:
-            f.write(css_content)
-        return css_path
-    
-    def generate_js(self):
-        """
-        Generate JavaScript for the review page.
-        
-        Returns:
-            str: Path to the generated JS file
-        """
-        js_content = """
+        /* Index page */
+        .commit-list, .revision-list {
+            background-color: #fff;
+            border: 1px solid #e1e4e8;
+            border-radius: 3px;
+            margin-bottom: 20px;
+        }
+        .commit-item, .revision-item {
+            padding: 16px;
+            border-bottom: 1px solid #e1e4e8;
+        }
+        .commit-item:last-child, .revision-item:last-child {
+            border-bottom: none;
+        }
+        .commit-title, .revision-title {
+            font-weight: 600;
+            margin-bottom: 8px;
+        }
+        .commit-meta, .revision-meta {
+            color: #586069;
+            font-size: 12px;
+            display: flex;
+            flex-wrap: wrap;
+        }
+        .commit-meta-item, .revision-meta-item {
+            margin-right: 16px;
+        }
+        """.encode('utf-8')
+
+_JS_CONTENT = """
         document.addEventListener('DOMContentLoaded', function() {
-            // Debug logging function
-            function gitDiffLog(...args) {
-                const debugLog = false; // Set to true for debugging
-                if (debugLog) {
-                    console.log('[GitDiff Debug]', ...args);
-                }
-            }
             // Folder expand/collapse
             document.querySelectorAll('.folder-label').forEach(function(label) {
                 label.addEventListener('click', function() {
@@ -757,19 +663,11 @@ class Render:
                     item.classList.add('active');
                     
                     const jumpId = item.getAttribute('data-jump');
-                    gitDiffLog('Scan result clicked, jumpId:', jumpId);
                     const codeElem = document.getElementById(jumpId);
-                    gitDiffLog('Found code element:', codeElem);
                     if (codeElem) {
                         codeElem.scrollIntoView({ behavior: 'smooth', block: 'center' });
                         codeElem.classList.add('scan-result-highlight');
                         setTimeout(() => codeElem.classList.remove('scan-result-highlight'), 1600);
-                        gitDiffLog('Scrolled to element successfully');
-                    } else {
-                        gitDiffLog('ERROR: Could not find element with ID:', jumpId);
-                        // Debug: list all scan-result elements
-                        const allScanResults = document.querySelectorAll('[id^="scanresult-"]');
-                        gitDiffLog('Available scan result IDs:', Array.from(allScanResults).map(el => el.id));
                     }
                 });
             });
@@ -791,136 +689,195 @@ class Render:
                     });
                 });
             }
-            // Expandable context logic
-            const fileContents = document.getElementById('new-file-contents');
-            if (fileContents) {
-                const fileContentData = JSON.parse(fileContents.textContent);
-                gitDiffLog('File content data loaded:', Object.keys(fileContentData));
-                document.querySelectorAll('.expand-icon').forEach(function(btn) {
-                    btn.addEventListener('click', function() {
-                        const tr = btn.closest('tr');
-                        const table = btn.closest('table');
-                        const filename = table.getAttribute('data-filename');
-                        const lines = fileContentData[filename] || [];
-                        let expandType = btn.getAttribute('data-expand');
-                        let contextStart = parseInt(btn.getAttribute('data-context-start'));
-                        let contextEnd = parseInt(btn.getAttribute('data-context-end'));
-                        
-                        gitDiffLog(`File data for "${filename}": ${lines ? lines.length : 'NOT FOUND'} lines`);
-                        
-                        // Handle 10-line expansion
-                        if (expandType === 'above-10') {
-                            contextStart = Math.max(contextStart, contextEnd - 9);
-                        } else if (expandType === 'below-10') {
-                            contextEnd = Math.min(contextEnd, contextStart + 9);
-                        }
-                        
-                        // Insert the context lines, but only if not already present
-                        gitDiffLog(`===== EXPAND BUTTON CLICKED =====`);
-                        gitDiffLog(`Expand type: ${expandType}`);
-                        gitDiffLog(`Original context range: ${btn.getAttribute('data-context-start')} to ${btn.getAttribute('data-context-end')}`);
-                        gitDiffLog(`Adjusted context range: ${contextStart} to ${contextEnd}`);
-                        gitDiffLog(`File: ${filename}`);
-                        gitDiffLog(`Total lines in file: ${lines.length}`);
-                        
-                        let insertedRows = [];
-                        let visibleLines = new Set();
-                        let allRows = Array.from(table.querySelectorAll('tr'));
-                        allRows.forEach((row, i) => {
-                            let lineNumCells = row.querySelectorAll('.diff-line-num');
-                            if (lineNumCells.length >= 2) {
-                                for (let j = 0; j < lineNumCells.length; j++) {
-                                    let lineText = lineNumCells[j].textContent.trim();
-                                    let lineNum = parseInt(lineText);
-                                    if (!isNaN(lineNum) && lineNum > 0) {
-                                        visibleLines.add(lineNum);
-                                    }
+            // Expandable context logic; each file's lines live in a sidecar
+            // script under assets/files/ that is loaded on first expand
+            const fileContentIndex = document.getElementById('file-content-index');
+            if (fileContentIndex) {
+                const fileDigests = JSON.parse(fileContentIndex.textContent);
+                window.reviewFileContents = window.reviewFileContents || {};
+                
+                // A script tag rather than fetch(), which is blocked for file:// pages
+                function loadFileLines(filename, callback) {
+                    const digest = fileDigests[filename];
+                    if (!digest) {
+                        callback([]);
+                        return;
+                    }
+                    if (window.reviewFileContents[digest]) {
+                        callback(window.reviewFileContents[digest]);
+                        return;
+                    }
+                    const script = document.createElement('script');
+                    script.src = 'assets/files/' + digest + '.js';
+                    script.onload = function() {
+                        callback(window.reviewFileContents[digest] || []);
+                    };
+                    script.onerror = function() {
+                        callback([]);
+                    };
+                    document.head.appendChild(script);
+                }
+                
+                // One delegated listener serves every expand button on the page
+                document.addEventListener('click', function(event) {
+                    const btn = event.target.closest('.expand-icon');
+                    if (!btn) return;
+                    const table = btn.closest('table');
+                    loadFileLines(table.getAttribute('data-filename'), function(lines) {
+                        expandContext(btn, lines);
+                    });
+                });
+                
+                // Line numbers shown in each table, scanned on first expand and
+                // kept up to date as rows are inserted
+                const tableVisibleLines = new WeakMap();
+                function getVisibleLines(table) {
+                    let visibleLines = tableVisibleLines.get(table);
+                    if (visibleLines) {
+                        return visibleLines;
+                    }
+                    visibleLines = new Set();
+                    table.querySelectorAll('tr').forEach(function(row) {
+                        let lineNumCells = row.querySelectorAll('.diff-line-num');
+                        if (lineNumCells.length >= 2) {
+                            for (let j = 0; j < lineNumCells.length; j++) {
+                                let lineText = lineNumCells[j].textContent.trim();
+                                let lineNum = parseInt(lineText);
+                                if (!isNaN(lineNum) && lineNum > 0) {
+                                    visibleLines.add(lineNum);
                                 }
                             }
-                        });
-                        
-                        // Collect all lines to insert first (skip already visible lines)
-                        let linesToInsert = [];
-                        gitDiffLog(`Collecting lines to insert from ${contextStart} to ${contextEnd}`);
-                        for (let ln = contextStart; ln <= contextEnd; ++ln) {
-                            if (!visibleLines.has(ln)) {
-                                let content = lines[ln - 1] || '';
-                                gitDiffLog(`Line ${ln}: "${content}" (array index: ${ln - 1})`);
-                                linesToInsert.push({lineNum: ln, content: content});
-                            } else {
-                                gitDiffLog(`Line ${ln}: SKIPPED (already visible)`);
-                            }
                         }
-                        gitDiffLog(`Total lines to insert: ${linesToInsert.length}`);
-                        
-                        // Find the insertion point for the entire block
-                        let insertionPoint = null;
-                        let rows = Array.from(table.tBodies[0].rows);
-                        
-                        for (let i = 0; i < rows.length; i++) {
-                            let row = rows[i];
-                            let lineNumCells = row.querySelectorAll('.diff-line-num');
-                            if (lineNumCells.length >= 2) {
-                                let maxLineNum = 0;
-                                for (let j = 0; j < lineNumCells.length; j++) {
-                                    let lineText = lineNumCells[j].textContent.trim();
-                                    let lineNum = parseInt(lineText);
-                                    if (!isNaN(lineNum) && lineNum > 0) {
-                                        maxLineNum = Math.max(maxLineNum, lineNum);
-                                    }
-                                }
-                                if (maxLineNum > 0 && maxLineNum > contextStart) {
-                                    insertionPoint = row;
-                                    break;
-                                }
+                    });
+                    tableVisibleLines.set(table, visibleLines);
+                    return visibleLines;
+                }
+                
+                // Expanded context rows are cloned from this one and filled in through
+                // textContent, so no HTML is parsed or escaped per row
+                const contextRowTemplate = document.createElement('tr');
+                contextRowTemplate.className = 'diff-context expanded-context';
+                contextRowTemplate.innerHTML = "<td class='diff-sign'>&nbsp;</td><td class='diff-line-num'></td><td class='diff-line-num'></td><td class='diff-line-content'></td>";
+                
+                // Largest line number shown in a row, or 0 for rows without two
+                // line number cells; parsed once and cached on the row
+                function getRowMaxLineNum(row) {
+                    if (row._maxLineNum !== undefined) {
+                        return row._maxLineNum;
+                    }
+                    let maxLineNum = 0;
+                    let lineNumCells = row.getElementsByClassName('diff-line-num');
+                    if (lineNumCells.length >= 2) {
+                        for (let j = 0; j < lineNumCells.length; j++) {
+                            let lineNum = parseInt(lineNumCells[j].textContent.trim());
+                            if (!isNaN(lineNum) && lineNum > 0) {
+                                maxLineNum = Math.max(maxLineNum, lineNum);
                             }
                         }
-                        
-                        if (!insertionPoint) {
-                            insertionPoint = tr;
+                    }
+                    row._maxLineNum = maxLineNum;
+                    return maxLineNum;
+                }
+                
+                function expandContext(btn, lines) {
+                    const tr = btn.closest('tr');
+                    const table = btn.closest('table');
+                    const filename = table.getAttribute('data-filename');
+                    let expandType = btn.getAttribute('data-expand');
+                    let contextStart = parseInt(btn.getAttribute('data-context-start'));
+                    let contextEnd = parseInt(btn.getAttribute('data-context-end'));
+                    
+                    // Handle 10-line expansion
+                    if (expandType === 'above-10') {
+                        contextStart = Math.max(contextStart, contextEnd - 9);
+                    } else if (expandType === 'below-10') {
+                        contextEnd = Math.min(contextEnd, contextStart + 9);
+                    }
+                    
+                    // Insert the context lines, but only if not already present
+                    
+                    let insertedRows = [];
+                    let visibleLines = getVisibleLines(table);
+                    
+                    // Collect all lines to insert first (skip already visible lines)
+                    let linesToInsert = [];
+                    for (let ln = contextStart; ln <= contextEnd; ++ln) {
+                        if (!visibleLines.has(ln)) {
+                            let content = lines[ln - 1] || '';
+                            linesToInsert.push({lineNum: ln, content: content});
+                            // Claimed now, so a click before later chunks land does not repeat them
+                            visibleLines.add(ln);
                         }
-                        
-                        // Insert all lines as a block in the correct order
-                        gitDiffLog(`Inserting ${linesToInsert.length} lines before insertion point`);
-                        linesToInsert.forEach(function(lineInfo, index) {
-                            let newRow = document.createElement('tr');
-                            newRow.className = 'diff-context expanded-context';
-                            newRow.innerHTML = `<td class='diff-sign'>&nbsp;</td><td class='diff-line-num'></td><td class='diff-line-num'>${lineInfo.lineNum}</td><td class='diff-line-content'>${escapeHtml(lineInfo.content)}</td>`;
-                            gitDiffLog(`Inserting line ${lineInfo.lineNum}: "${lineInfo.content}"`);
-                            table.tBodies[0].insertBefore(newRow, insertionPoint);
+                    }
+                    
+                    // Find the insertion point for the entire block
+                    let insertionPoint = null;
+                    let rows = table.tBodies[0].rows;
+                    
+                    for (let i = 0; i < rows.length; i++) {
+                        let row = rows[i];
+                        let maxLineNum = getRowMaxLineNum(row);
+                        if (maxLineNum > 0 && maxLineNum > contextStart) {
+                            insertionPoint = row;
+                            break;
+                        }
+                    }
+                    
+                    if (!insertionPoint) {
+                        insertionPoint = tr;
+                    }
+                    
+                    // Insert the lines in order, a chunk of rows per fragment so the
+                    // table reflows once per chunk; later chunks wait for the next frame
+                    const tbody = table.tBodies[0];
+                    const chunkSize = Math.max(50, Math.ceil(linesToInsert.length / 20));
+                    function insertChunk(offset, before) {
+                        const frag = document.createDocumentFragment();
+                        const end = Math.min(offset + chunkSize, linesToInsert.length);
+                        for (let k = offset; k < end; k++) {
+                            let lineInfo = linesToInsert[k];
+                            let newRow = contextRowTemplate.cloneNode(true);
+                            newRow.cells[2].textContent = lineInfo.lineNum;
+                            newRow.cells[3].textContent = lineInfo.content;
+                            newRow._maxLineNum = lineInfo.lineNum;
+                            frag.appendChild(newRow);
                             insertedRows.push(newRow);
-                        });
+                        }
+                        tbody.insertBefore(frag, before);
+                        if (end < linesToInsert.length) {
+                            // Anchor on the last inserted row, since the expand row may be gone by then
+                            const lastRow = insertedRows[insertedRows.length - 1];
+                            requestAnimationFrame(function() { insertChunk(end, lastRow.nextSibling); });
+                        }
+                    }
+                    if (linesToInsert.length > 0) {
+                        insertChunk(0, insertionPoint);
+                    }
+                    
+                    // For 10-line expansions, update the button range and keep it
+                    if (expandType.endsWith('-10')) {
+                        let originalStart = parseInt(btn.getAttribute('data-context-start'));
+                        let originalEnd = parseInt(btn.getAttribute('data-context-end'));
                         
-                        // For 10-line expansions, update the button range and keep it
-                        if (expandType.endsWith('-10')) {
-                            let originalStart = parseInt(btn.getAttribute('data-context-start'));
-                            let originalEnd = parseInt(btn.getAttribute('data-context-end'));
-                            
-                            if (expandType === 'above-10') {
-                                let newEnd = contextStart - 1;
-                                if (newEnd >= originalStart) {
-                                    btn.setAttribute('data-context-end', newEnd);
-                                } else {
-                                    tr.remove();
-                                }
-                            } else if (expandType === 'below-10') {
-                                let newStart = contextEnd + 1;
-                                if (newStart <= originalEnd) {
-                                    btn.setAttribute('data-context-start', newStart);
-                                } else {
-                                    tr.remove();
-                                }
+                        if (expandType === 'above-10') {
+                            let newEnd = contextStart - 1;
+                            if (newEnd >= originalStart) {
+                                btn.setAttribute('data-context-end', newEnd);
+                            } else {
+                                tr.remove();
+                            }
+                        } else if (expandType === 'below-10') {
+                            let newStart = contextEnd + 1;
+                            if (newStart <= originalEnd) {
+                                btn.setAttribute('data-context-start', newStart);
+                            } else {
+                                tr.remove();
                             }
-                        } else {
-                            tr.remove();
                         }
-                    });
-                });
-            }
-            
-            function escapeHtml(text) {
-                var map = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#039;' };
-                return text.replace(/[&<>"']/g, function(m) { return map[m]; });
+                    } else {
+                        tr.remove();
+                    }
+                }
             }
             
             // Fixed header scroll functionality
@@ -946,12 +903,9 @@ class Render:
             function scrollScanResultItemIntoView(scanResultItem) {
                 if (!scanResultItem) return;
                 
-                gitDiffLog('Auto-scrolling scan result item into view:', scanResultItem);
-                
                 // Find the scan results panel container
                 const scanResultsList = document.querySelector('.scan-results-list');
                 if (!scanResultsList) {
-                    gitDiffLog('ERROR: .scan-results-list not found for auto-scroll');
                     return;
                 }
                 
@@ -959,32 +913,11 @@ class Render:
                 const itemRect = scanResultItem.getBoundingClientRect();
                 const containerRect = scanResultsList.getBoundingClientRect();
                 
-                gitDiffLog('Scroll container info:', {
-                    containerTop: containerRect.top,
-                    containerBottom: containerRect.bottom,
-                    containerHeight: containerRect.height,
-                    containerScrollTop: scanResultsList.scrollTop,
-                    containerScrollHeight: scanResultsList.scrollHeight
-                });
-                
-                gitDiffLog('Item info:', {
-                    itemTop: itemRect.top,
-                    itemBottom: itemRect.bottom,
-                    itemHeight: itemRect.height
-                });
-                
                 // Check if item is visible within container
                 const itemTopRelativeToContainer = itemRect.top - containerRect.top;
                 const itemBottomRelativeToContainer = itemRect.bottom - containerRect.top;
                 
-                gitDiffLog('Item relative position:', {
-                    itemTopRelative: itemTopRelativeToContainer,
-                    itemBottomRelative: itemBottomRelativeToContainer,
-                    containerHeight: containerRect.height
-                });
-                
                 const isItemVisible = itemTopRelativeToContainer >= 0 && itemBottomRelativeToContainer <= containerRect.height;
-                gitDiffLog('Is item visible:', isItemVisible);
                 
                 if (!isItemVisible) {
                     // Calculate scroll position to center the item in the container
@@ -994,34 +927,22 @@ class Render:
                     
                     const newScrollTop = scanResultsList.scrollTop + scrollOffset;
                     
-                    gitDiffLog('Scrolling scan results panel:', {
-                        currentScrollTop: scanResultsList.scrollTop,
-                        scrollOffset: scrollOffset,
-                        newScrollTop: newScrollTop
-                    });
-                    
                     // Smooth scroll to the new position
                     scanResultsList.scrollTo({
                         top: Math.max(0, newScrollTop),
                         behavior: 'smooth'
                     });
-                } else {
-                    gitDiffLog('Item is already visible, no scroll needed');
                 }
             }
             
             // Auto-highlight scan results based on scroll position
             function updateScanResultHighlightOnScroll(scrollContainer, containerName) {
-                gitDiffLog('=== SCROLL EVENT TRIGGERED (' + (containerName || 'unknown') + ') ===');
-                
                 // Determine the actual scroll container to use
                 let actualContainer = scrollContainer;
                 if (!actualContainer) {
                     actualContainer = document.querySelector('.diff-panel') || document.body;
                 }
                 
-                gitDiffLog('Using scroll container:', containerName || 'fallback', actualContainer);
-                
                 // Calculate viewport based on the container
                 let viewportTop, viewportBottom, viewportCenter, clientHeight;
                 
@@ -1031,35 +952,25 @@ class Render:
                     clientHeight = window.innerHeight;
                     viewportBottom = viewportTop + clientHeight;
                     viewportCenter = viewportTop + (clientHeight / 2);
-                    gitDiffLog('Using window scroll - pageYOffset:', viewportTop, 'innerHeight:', clientHeight);
                 } else {
                     // For element scroll, use element dimensions
                     viewportTop = actualContainer.scrollTop;
                     clientHeight = actualContainer.clientHeight;
                     viewportBottom = viewportTop + clientHeight;
                     viewportCenter = viewportTop + (clientHeight / 2);
-                    gitDiffLog('Using element scroll - scrollTop:', viewportTop, 'clientHeight:', clientHeight);
                 }
                 
-                gitDiffLog('Viewport - Top:', viewportTop, 'Center:', viewportCenter, 'Bottom:', viewportBottom, 'ClientHeight:', clientHeight);
-                
                 // Find all scan result elements in the code
                 const scanResultElements = document.querySelectorAll('[id^="scanresult-"]');
-                gitDiffLog('Total scan result elements found:', scanResultElements.length);
                 
                 if (scanResultElements.length === 0) {
-                    gitDiffLog('WARNING: No scan result elements found with id starting with "scanresult-"');
-                    // Let's check what IDs are actually available
-                    const allElementsWithId = document.querySelectorAll('[id]');
-                    gitDiffLog('All elements with IDs:', Array.from(allElementsWithId).map(el => el.id));
                     return;
                 }
                 
                 let closestScanResult = null;
                 let closestDistance = Infinity;
-                let visibleCount = 0;
                 
-                scanResultElements.forEach(function(element, index) {
+                scanResultElements.forEach(function(element) {
                     try {
                         const rect = element.getBoundingClientRect();
                         
@@ -1085,43 +996,26 @@ class Render:
                         // Check if element is visible in viewport
                         const isVisible = elementTop < viewportBottom && elementBottom > viewportTop;
                         
-                        gitDiffLog('Element ' + (index + 1) + '/' + scanResultElements.length + ':', {
-                            id: element.id,
-                            elementTop: elementTop,
-                            elementBottom: elementBottom,
-                            elementCenter: elementCenter,
-                            distance: distance,
-                            isVisible: isVisible,
-                            rectHeight: rect.height
-                        });
-                        
                         if (isVisible) {
-                            visibleCount++;
                             if (distance < closestDistance) {
                                 closestDistance = distance;
                                 closestScanResult = element;
-                                gitDiffLog('New closest scan result:', element.id, 'Distance:', distance);
                             }
                         }
                     } catch (error) {
-                        gitDiffLog('Error processing element:', element.id, error);
+                        // Skip elements removed while scrolling
                     }
                 });
                 
-                gitDiffLog('Summary - Visible elements:', visibleCount, 'Closest:', closestScanResult ? closestScanResult.id : 'none');
-                
                 if (closestScanResult) {
                     const scanResultId = closestScanResult.id;
-                    gitDiffLog('Processing closest scan result:', scanResultId);
                     
                     // Find corresponding scan result item in the panel
                     const scanResultItem = document.querySelector(`.scan-result-item[data-jump="${scanResultId}"]`);
-                    gitDiffLog('Found scan result item in panel:', !!scanResultItem);
                     
                     if (scanResultItem) {
                         // Remove active class from all scan result items
                         const allScanItems = document.querySelectorAll('.scan-result-item');
-                        gitDiffLog('Total scan result items in panel:', allScanItems.length);
                         
                         allScanItems.forEach(function(item) {
                             item.classList.remove('active');
@@ -1129,21 +1023,11 @@ class Render:
                         
                         // Add active class to the corresponding item
                         scanResultItem.classList.add('active');
-                        gitDiffLog('Successfully highlighted scan result item:', scanResultId);
                         
                         // Auto-scroll the scan results panel to keep the highlighted item visible
                         scrollScanResultItemIntoView(scanResultItem);
-                    } else {
-                        gitDiffLog('ERROR: Could not find scan result item with data-jump="' + scanResultId + '"');
-                        // Debug: show all available data-jump values
-                        const allScanItems = document.querySelectorAll('.scan-result-item[data-jump]');
-                        gitDiffLog('Available data-jump values:', Array.from(allScanItems).map(item => item.getAttribute('data-jump')));
                     }
-                } else {
-                    gitDiffLog('No closest scan result found - no elements visible or no elements exist');
                 }
-                
-                gitDiffLog('=== SCROLL EVENT COMPLETED ===');
             }
             
             // Add scroll event listener with throttling
@@ -1153,40 +1037,11 @@ class Render:
             const diffPanel = document.querySelector('.diff-panel');
             const reviewMain = document.querySelector('.review-main');
             const body = document.body;
-            const htmlElement = document.documentElement;
-            
-            gitDiffLog('Container elements found:');
-            gitDiffLog('- .diff-panel:', !!diffPanel);
-            gitDiffLog('- .review-main:', !!reviewMain);
-            gitDiffLog('- body:', !!body);
-            gitDiffLog('- html:', !!htmlElement);
-            
-            // Check which elements are actually scrollable
-            function checkScrollable(element, name) {
-                if (!element) return false;
-                const hasVerticalScroll = element.scrollHeight > element.clientHeight;
-                const overflowY = window.getComputedStyle(element).overflowY;
-                gitDiffLog(name + ' scroll info:', {
-                    scrollHeight: element.scrollHeight,
-                    clientHeight: element.clientHeight,
-                    hasVerticalScroll: hasVerticalScroll,
-                    overflowY: overflowY,
-                    scrollTop: element.scrollTop
-                });
-                return hasVerticalScroll;
-            }
-            
-            checkScrollable(diffPanel, '.diff-panel');
-            checkScrollable(reviewMain, '.review-main');
-            checkScrollable(body, 'body');
-            checkScrollable(htmlElement, 'html');
             
             function setupScrollListener(element, name) {
                 if (!element) return false;
                 
-                gitDiffLog('Setting up scroll listener on:', name);
                 element.addEventListener('scroll', function() {
-                    gitDiffLog('SCROLL EVENT FIRED on ' + name + ' - scrollTop:', element.scrollTop);
                     clearTimeout(scrollTimeout);
                     scrollTimeout = setTimeout(function() {
                         updateScanResultHighlightOnScroll(element, name);
@@ -1196,19 +1051,15 @@ class Render:
             }
             
             // Try to set up scroll listeners on multiple potential containers
-            let listenersAdded = 0;
-            if (setupScrollListener(diffPanel, '.diff-panel')) listenersAdded++;
-            if (setupScrollListener(reviewMain, '.review-main')) listenersAdded++;
-            if (setupScrollListener(body, 'body')) listenersAdded++;
-            if (setupScrollListener(window, 'window')) listenersAdded++;
-            
-            gitDiffLog('Total scroll listeners added:', listenersAdded);
+            setupScrollListener(diffPanel, '.diff-panel');
+            setupScrollListener(reviewMain, '.review-main');
+            setupScrollListener(body, 'body');
+            setupScrollListener(window, 'window');
             
             // Add scroll listener for fixed header
             window.addEventListener('scroll', handleFixedHeader);
             
             // Set initial state to highlight first scan result item
-            gitDiffLog('Setting initial scan result highlight to first item');
             setTimeout(function() {
                 // Find the first scan result item and highlight it
                 const firstScanResultItem = document.querySelector('.scan-result-item[data-jump]');
@@ -1220,18 +1071,221 @@ class Render:
                     
                     // Add active class to first item
                     firstScanResultItem.classList.add('active');
-                    gitDiffLog('First scan result item highlighted:', firstScanResultItem.getAttribute('data-jump'));
-                } else {
-                    gitDiffLog('No scan result items found for initial highlighting');
                 }
             }, 500);
         });
+        """.encode('utf-8')
+
+
+class Render:
+    """
+    A class to handle common rendering functionality for review pages.
+    """
+    
+    def __init__(self, output_dir, assets_dir):
         """
+        Initialize the renderer with output directories.
         
-        js_path = os.path.join(self.assets_dir, 'script.js')
-        with open(js_path, 'w', encoding='utf-8') as f:
-            f.write(js_content)
+        Args:
+            output_dir (str): Directory to output the generated HTML files
+            assets_dir (str): Directory for CSS/JS assets
+        """
+        self.output_dir = output_dir
+        self.assets_dir = assets_dir
+    
+    def _normalize_path_for_matching(self, file_path):
+        """
+        Normalize file paths for matching between scan results and SVN paths.
+        
+        Args:
+            file_path (str): The file path to normalize
             
+        Returns:
+            str: Normalized path for matching
+        """
+        # Convert to forward slashes
+        normalized = file_path.replace('\\', '/')
+        
+        # Remove drive letters and common prefixes
+        prefixes_to_remove = [
+            r'^[A-Za-z]:/[^/]+/',  # Remove drive + first directory (e.g., "D:/serverdev/")
+            r'^[A-Za-z]:\\[^\\]+\\',  # Remove drive + first directory (Windows style)
+            r'^src/',  # Remove src/ prefix
+            r'^trunk/',  # Remove trunk/ prefix
+        ]
+        
+        for prefix_pattern in prefixes_to_remove:
+            normalized = re.sub(prefix_pattern, '', normalized, flags=re.IGNORECASE)
+        
+        return normalized.lower()
+    
+    def _convert_urls_to_links(self, text):
+        """
+        Convert https URLs in text to clickable HTML links.
+        
+        Args:
+            text (str): Text that may contain https URLs
+            
+        Returns:
+            str: Text with URLs converted to HTML links
+        """
+        # First escape HTML to prevent XSS
+        escaped_text = html.escape(text)
+        
+        # URL pattern to match https links
+        url_pattern = r'https://[^\s<>"\']*'
+        
+        def replace_url(match):
+            url = match.group(0)
+            return f'<a href="{url}" target="_blank">{url}</a>'
+        
+        # Replace URLs with links
+        return re.sub(url_pattern, replace_url, escaped_text)
+    
+    def _find_matching_scan_result(self, scan_results, filename, line_num):
+        """
+        Find scan result that matches the given filename and line number.
+        Uses both exact matching and normalized path matching.
+        
+        Args:
+            scan_results (list): List of scan results
+            filename (str): The filename to match
+            line_num (int): The line number to match
+            
+        Returns:
+            dict or None: Matching scan result or None if not found
+        """
+        line_str = str(line_num)
+        
+        # First try exact filename match
+        exact_match = next((r for r in scan_results 
+                           if str(r['行号']) == line_str and r['文件名'] == filename), None)
+        if exact_match:
+            return exact_match
+        
+        # Try normalized path matching
+        normalized_target = self._normalize_path_for_matching(filename)
+        
+        for result in scan_results:
+            if str(result['行号']) == line_str:
+                normalized_scan_path = self._normalize_path_for_matching(result['文件名'])
+                if normalized_scan_path == normalized_target:
+                    return result
+                
+                # Also try basename matching as fallback
+                if os.path.basename(result['文件名']) == os.path.basename(filename):
+                    return result
+        
+        # Try custom path mappings (add your specific mappings here)
+        custom_mappings = {
+            # Example: Map scan result path to SVN path
+            # 'D:\\serverdev\\Server\\MatchServer\\MatchManager.cpp': 'src/Server/AllPlayerTeamMatchServer/AllPlayerTeamMatchCourse.cpp',
+        }
+        
+        # Check if SVN filename has a mapping to a scan result path
+        for scan_path, svn_path in custom_mappings.items():
+            if svn_path == filename:
+                for result in scan_results:
+                    if str(result['行号']) == line_str and result['文件名'] == scan_path:
+                        return result
+        
+        return None
+    
+    def _build_file_tree(self, files_changed):
+        """
+        Build a nested dictionary representing the folder/file tree from a flat file list.
+        """
+        tree = {}
+        # Folder nodes along the previous file's path; nodes[k] is the folder
+        # reached after k components, so a shared prefix is not walked again
+        prev_dirs = []
+        nodes = [tree]
+        for idx, file_info in enumerate(files_changed):
+            *dirs, base_name = file_info['filename'].split('/')
+            common = 0
+            for prev_part, part in zip(prev_dirs, dirs):
+                if prev_part != part:
+                    break
+                common += 1
+            del nodes[common + 1:]
+            node = nodes[-1]
+            for part in dirs[common:]:
+                node = node.setdefault(part, {})
+                nodes.append(node)
+            node[base_name] = {'__file__': file_info, '__index__': idx}
+            prev_dirs = dirs
+        return tree
+
+    def _render_file_tree(self, tree, parent_path="", level=0, parts=None):
+        """
+        Recursively render the file tree as nested <ul>/<li> HTML.
+        
+        Nested levels append to the caller's parts list; only the outermost
+        call joins it.
+        """
+        if parts is None:
+            parts = []
+            self._render_file_tree(tree, parent_path, level, parts)
+            return ''.join(parts)
+        
+        append = parts.append
+        append('<ul class="file-tree' + (" root" if level == 0 else "") + '">')
+        for name, value in sorted(tree.items()):
+            if isinstance(value, dict) and '__file__' in value:
+                file_info = value['__file__']
+                idx = value['__index__']
+                status_class = file_info['status']
+                status_text = file_info['status'].capitalize()
+                # Leaves are keyed by the file's base name in _build_file_tree
+                append(f'<li class="file-leaf"><div class="file-item" data-diff-id="diff-{idx}"><span class="file-status {status_class}">{status_text}</span><span class="file-name">{escape_path(name)}</span></div></li>')
+            else:
+                folder_id = f"folder-{parent_path.replace('/', '-')}-{name}".replace(' ', '-')
+                escaped_name = escape_path(name)
+                append(f'<li class="file-folder" data-folder="{escaped_name}"><div class="folder-label" data-folder-id="{folder_id}"><span class="folder-caret">▶</span><span class="folder-name">{escaped_name}</span></div>')
+                self._render_file_tree(value, parent_path + name + '/', level+1, parts)
+                append('</li>')
+        append('</ul>')
+    
+    def _write_asset(self, path, content):
+        """
+        Write an asset file unless it already holds the same content.
+        
+        Args:
+            path (str): Path to the asset file
+            content (bytes): Encoded content to write
+            
+        Returns:
+            bool: True if the file was written, False if it was up to date
+        """
+        # A size mismatch means the file is stale without reading it
+        if os.path.exists(path) and os.path.getsize(path) == len(content):
+            with open(path, 'rb') as f:
+                if f.read() == content:
+                    return False
+        with open(path, 'wb') as f:
+            f.write(content)
+        return True
+    
+    def generate_css(self):
+        """
+        Generate CSS for the review page.
+        
+        Returns:
+            str: Path to the generated CSS file
+        """
+        css_path = os.path.join(self.assets_dir, 'style.css')
+        self._write_asset(css_path, _CSS_CONTENT)
+        return css_path
+    
+    def generate_js(self):
+        """
+        Generate JavaScript for the review page.
+        
+        Returns:
+            str: Path to the generated JS file
+        """
+        js_path = os.path.join(self.assets_dir, 'script.js')
+        self._write_asset(js_path, _JS_CONTENT)
         return js_path
     
     def render_scan_results_panel(self, scan_results):
@@ -1268,7 +1322,32 @@ class Render:
         html_parts.append('</div>')
         return '\n'.join(html_parts)
     
-    def parse_diff_to_html_with_expand(self, diff_text, filename, file_idx, scan_results, repo_path):
+    def render_deleted_file(self, diff_text=None):
+        """
+        Render a deleted file as a one-line note instead of a table of removed lines.
+        
+        Args:
+            diff_text (str, optional): The diff text of the deleted file, used for
+                the line count; the count is left out when not given, or when the
+                diff is binary or has no hunks to count
+            
+        Returns:
+            str: HTML string
+        """
+        if diff_text is None or is_binary_diff(diff_text):
+            return "<div class='diff-empty'>File deleted</div>"
+        
+        # Hunks of a deletion cover the whole old file, so their old counts add up to its length
+        line_count = None
+        for line in diff_text.split('\n'):
+            match = HUNK_HEADER_RE.match(line) if line[:1] == '@' else None
+            if match:
+                line_count = (line_count or 0) + int(match.group('old_count') or '1')
+        if line_count is None:
+            return "<div class='diff-empty'>File deleted</div>"
+        return f"<div class='diff-empty'>File deleted ({line_count} lines)</div>"
+    
+    def parse_diff_to_html_with_expand(self, diff_text, filename, file_idx, scan_results, repo_path, full_lines=None):
         """
         Parse diff to HTML with expandable context and scan results.
         Treats scan results as fake diff hunks with [-10, +10] context to unify the rendering logic.
@@ -1279,68 +1358,77 @@ class Render:
             file_idx (int): Index of the file in the file list
             scan_results (list): List of scan results
             repo_path (str): Path to the repository for reading file contents
+            full_lines (list, optional): Lines of the new file; read from disk when not given
             
         Returns:
             tuple: (HTML string, hunk metadata)
         """
-        # Get the full new file content for context
-        try:
-            # Try multiple possible locations for the file with proper Windows path handling
-            file_paths = []
+        # Binary and oversized diffs render as a short note, without reading the file
+        if diff_text and is_binary_diff(diff_text):
+            return "<div class='diff-empty'>Binary file not shown</div>", []
+        if diff_text and is_oversized_diff(diff_text):
+            diff_line_count = diff_text.count('\n') + 1
+            return f"<div class='diff-empty'>Diff too large to display ({diff_line_count} lines)</div>", []
+        
+        # Get the full new file content for context, unless the caller already has it
+        if full_lines is None:
+            try:
+                # Try multiple possible locations for the file with proper Windows path handling
+                file_paths = []
             
-            # Normalize paths for Windows
-            repo_path_normalized = repo_path.replace('\\', '/')
-            repo_parent = os.path.dirname(repo_path)
-            repo_parent_normalized = repo_parent.replace('\\', '/')
+                # Normalize paths for Windows
+                repo_path_normalized = repo_path.replace('\\', '/')
+                repo_parent = os.path.dirname(repo_path)
+                repo_parent_normalized = repo_parent.replace('\\', '/')
             
-            # Try exact path
-            file_paths.append(os.path.join(repo_path, filename))
+                # Try exact path
+                file_paths.append(os.path.join(repo_path, filename))
             
-            # Try with normalized repo path (this pattern worked in scan results loading)
-            file_paths.append(repo_path_normalized + '/' + filename.replace('\\', '/'))
+                # Try with normalized repo path (this pattern worked in scan results loading)
+                file_paths.append(repo_path_normalized + '/' + filename.replace('\\', '/'))
             
-            # Try trunk path 
-            file_paths.append(os.path.join(repo_path, 'trunk', filename))
+                # Try trunk path 
+                file_paths.append(os.path.join(repo_path, 'trunk', filename))
             
-            # Try parent directory
-            file_paths.append(os.path.join(repo_parent, filename))
+                # Try parent directory
+                file_paths.append(os.path.join(repo_parent, filename))
             
-            # Try parent/trunk
-            file_paths.append(os.path.join(repo_parent, 'trunk', filename))
+                # Try parent/trunk
+                file_paths.append(os.path.join(repo_parent, 'trunk', filename))
             
-            # Try with parent normalized (another pattern that might work)
-            file_paths.append(repo_parent_normalized + '/' + filename.replace('\\', '/'))
+                # Try with parent normalized (another pattern that might work)
+                file_paths.append(repo_parent_normalized + '/' + filename.replace('\\', '/'))
             
-            # Try without src/ prefix if present
-            if filename.startswith('src/'):
-                filename_without_src = filename[4:]  # Remove 'src/' prefix
-                file_paths.append(os.path.join(repo_path, filename_without_src))
-                file_paths.append(repo_path_normalized + '/' + filename_without_src.replace('\\', '/'))
-                file_paths.append(os.path.join(repo_parent, filename_without_src))
-                file_paths.append(repo_parent_normalized + '/' + filename_without_src.replace('\\', '/'))
+                # Try without src/ prefix if present
+                if filename.startswith('src/'):
+                    filename_without_src = filename[4:]  # Remove 'src/' prefix
+                    file_paths.append(os.path.join(repo_path, filename_without_src))
+                    file_paths.append(repo_path_normalized + '/' + filename_without_src.replace('\\', '/'))
+                    file_paths.append(os.path.join(repo_parent, filename_without_src))
+                    file_paths.append(repo_parent_normalized + '/' + filename_without_src.replace('\\', '/'))
             
-            full_lines = []
-            print(f"DEBUG: Looking for file {filename}")
-            print(f"DEBUG: repo_path = {repo_path}")
-            print(f"DEBUG: repo_path_normalized = {repo_path_normalized}")
-            print(f"DEBUG: repo_parent = {repo_parent}")
-            print(f"DEBUG: Trying these paths:")
-            for file_path in file_paths:
-                print(f"  - {file_path} ({'EXISTS' if os.path.exists(file_path) else 'NOT FOUND'})")
-                if os.path.exists(file_path):
-                    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                        full_lines = f.read().splitlines()
-                        print(f"DEBUG: Successfully loaded {len(full_lines)} lines from {file_path}")
-                        break
+                full_lines = []
+                print(f"DEBUG: Looking for file {filename}")
+                print(f"DEBUG: repo_path = {repo_path}")
+                print(f"DEBUG: repo_path_normalized = {repo_path_normalized}")
+                print(f"DEBUG: repo_parent = {repo_parent}")
+                print(f"DEBUG: Trying these paths:")
+                for file_path in file_paths:
+                    print(f"  - {file_path} ({'EXISTS' if os.path.exists(file_path) else 'NOT FOUND'})")
+                    if os.path.exists(file_path):
+                        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                            full_lines = f.read().splitlines()
+                            print(f"DEBUG: Successfully loaded {len(full_lines)} lines from {file_path}")
+                            break
             
-            if not full_lines:
-                error_msg = f"CRITICAL ERROR: Could not find file {filename} in any of these locations: {file_paths}"
-                print(error_msg)
-                raise FileNotFoundError(error_msg)
+                if not full_lines:
+                    error_msg = f"CRITICAL ERROR: Could not find file {filename} in any of these locations: {file_paths}"
+                    print(error_msg)
+                    raise FileNotFoundError(error_msg)
                 
-        except Exception as e:
-            print(f"Error reading file {filename} from {file_paths}: {str(e)}")
-            raise
+            except Exception as e:
+                print(f"Error reading file {filename} from {file_paths}: {str(e)}")
+                raise
         
         # Parse original diff hunks
         all_hunks = []
@@ -1349,14 +1437,15 @@ class Render:
             i = 0
             while i < len(lines):
                 line = lines[i]
-                if line.startswith('@@'):
-                    match = re.match(r'^@@ -(?P<old_start>\d+)(?:,(?P<old_count>\d+))? \+(?P<new_start>\d+)(?:,(?P<new_count>\d+))? @@', line)
+                if line[:1] == '@':
+                    match = HUNK_HEADER_RE.match(line)
                     if match:
                         new_start = int(match.group('new_start'))
                         new_count = int(match.group('new_count') or '1')
                         all_hunks.append({
                             'type': 'real_diff',
                             'diff_idx': i,
+                            'old_start': int(match.group('old_start')),
                             'new_start': new_start,
                             'new_count': new_count,
                             'original_lines': lines
@@ -1375,21 +1464,22 @@ class Render:
                 lines = hunk['original_lines']
                 hunk_header = lines[hunk['diff_idx']]
                 print(f"Hunk header: {hunk_header}")
-                match = re.match(r'^@@ -(?P<old_start>\d+)(?:,(?P<old_count>\d+))? \+(?P<new_start>\d+)(?:,(?P<new_count>\d+))? @@', hunk_header)
-                if match:
-                    cur_new = int(match.group('new_start'))
-                    original_cur_new = cur_new
-                    j = hunk['diff_idx'] + 1
-                    covered_lines_in_hunk = []
-                    while j < len(lines) and not lines[j].startswith('@@'):
-                        l = lines[j]
-                        if l.startswith('+') or l.startswith(' '):
-                            covered_lines.add(cur_new)
-                            covered_lines_in_hunk.append(cur_new)
-                            cur_new += 1
-                        # Deleted lines (starting with '-') don't increment new line number
-                        j += 1
-                    print(f"  Real diff covers lines: {sorted(covered_lines_in_hunk)} (range: {original_cur_new}-{cur_new-1})")
+                cur_new = hunk['new_start']
+                original_cur_new = cur_new
+                j = hunk['diff_idx'] + 1
+                covered_lines_in_hunk = []
+                n_lines = len(lines)
+                while j < n_lines:
+                    c = lines[j][:1]
+                    if c == '@':
+                        break
+                    if c == '+' or c == ' ':
+                        covered_lines.add(cur_new)
+                        covered_lines_in_hunk.append(cur_new)
+                        cur_new += 1
+                    # Deleted lines (starting with '-') don't increment new line number
+                    j += 1
+                print(f"  Real diff covers lines: {sorted(covered_lines_in_hunk)} (range: {original_cur_new}-{cur_new-1})")
         
         print(f"\nTotal covered lines by real diffs: {sorted(covered_lines)}")
         
@@ -1473,7 +1563,7 @@ class Render:
         # Now render all hunks using unified logic
         html_lines = []
         html_lines.append("<div class='diff-content'>")
-        html_lines.append(f"<table class='diff-table' data-filename='{html.escape(filename)}' data-file-idx='{file_idx}'>")
+        html_lines.append(f"<table class='diff-table' data-filename='{escape_path(filename)}' data-file-idx='{file_idx}'>")
         
         prev_hunk_end = 0
         hunk_meta = []
@@ -1516,31 +1606,37 @@ class Render:
     
     def _render_real_diff_hunk(self, html_lines, hunk, scan_results, filename, full_lines):
         """Render a real diff hunk."""
+        escape = html.escape
+        append = html_lines.append
+        row_added, row_removed, row_context = ROW_ADDED, ROW_REMOVED, ROW_CONTEXT
         lines = hunk['original_lines']
         hunk_header_line = lines[hunk['diff_idx']]
-        html_lines.append(f"<tr class='diff-hunk-header'><td colspan='4'>{html.escape(hunk_header_line)}</td></tr>")
+        append(ROW_HUNK_HEADER % escape(hunk_header_line))
         
-        # Parse the hunk to get starting line numbers
-        match = re.match(r'^@@ -(?P<old_start>\d+)(?:,(?P<old_count>\d+))? \+(?P<new_start>\d+)(?:,(?P<new_count>\d+))? @@', hunk_header_line)
-        cur_old = int(match.group('old_start')) if match else None
+        # Starting line numbers were parsed from the header when the hunk was collected
+        cur_old = hunk['old_start']
         cur_new = hunk['new_start']
         
         # Track which scan results have already been rendered in this hunk to avoid duplicates
         rendered_scan_results = set()
         
-        # Render hunk lines
+        # Render hunk lines; code only lands in cell text, never in attributes,
+        # so quotes are left unescaped
         j = hunk['diff_idx'] + 1
-        while j < len(lines) and not lines[j].startswith('@@'):
+        n_lines = len(lines)
+        while j < n_lines:
             l = lines[j]
             
+            c = l[:1]
+            if c == '@':
+                break
+            
             # Check for scan results on this line
             scan_line_num = None
-            if l.startswith('+'):
-                scan_line_num = cur_new
-            elif l.startswith('-'):
-                scan_line_num = cur_old  
-            elif l.startswith(' '):
+            if c == '+' or c == ' ':
                 scan_line_num = cur_new
+            elif c == '-':
+                scan_line_num = cur_old
                 
             if scan_line_num:
                 scan_result = self._find_matching_scan_result(scan_results, filename, scan_line_num)
@@ -1564,17 +1660,17 @@ class Render:
                         # Get the count of issues
                         issue_count = scan_result.get('问题数量', 1)
                         count_text = f"({issue_count} issues)" if issue_count > 1 else ""
-                        html_lines.append(f"<tr class='scan-result' id='{jump_id}'><td class='diff-sign'></td><td class='diff-line-num'></td><td class='diff-line-num'></td><td class='diff-line-content scan-result-content {severity_class}'><div class='scan-result-header'><span class='scan-result-cid {cid_class}'>{cid_number}</span><span>{remind_text}</span><span class='scan-result-count'>{count_text}</span></div><div class='scan-result-description'>{html.escape(scan_result['问题描述'])}</div><div class='scan-result-suggestion'>{html.escape(scan_result['修改意见'])}</div></td></tr>")
+                        append(f"<tr class='scan-result' id='{jump_id}'><td class='diff-sign'></td><td class='diff-line-num'></td><td class='diff-line-num'></td><td class='diff-line-content scan-result-content {severity_class}'><div class='scan-result-header'><span class='scan-result-cid {cid_class}'>{cid_number}</span><span>{remind_text}</span><span class='scan-result-count'>{count_text}</span></div><div class='scan-result-description'>{escape(scan_result['问题描述'])}</div><div class='scan-result-suggestion'>{escape(scan_result['修改意见'])}</div></td></tr>")
             
             # Render the actual diff line
-            if l.startswith('+'):
-                html_lines.append(f"<tr class='diff-added'><td class='diff-sign'>+</td><td class='diff-line-num'></td><td class='diff-line-num'>{cur_new}</td><td class='diff-line-content'>{html.escape(l[1:])}</td></tr>")
+            if c == '+':
+                append(row_added % (cur_new, escape(l[1:], False)))
                 cur_new += 1
-            elif l.startswith('-'):
-                html_lines.append(f"<tr class='diff-removed'><td class='diff-sign'>-</td><td class='diff-line-num'>{cur_old}</td><td class='diff-line-num'></td><td class='diff-line-content'>{html.escape(l[1:])}</td></tr>")
+            elif c == '-':
+                append(row_removed % (cur_old, escape(l[1:], False)))
                 cur_old += 1
-            elif l.startswith(' '):
-                html_lines.append(f"<tr class='diff-context'><td class='diff-sign'>&nbsp;</td><td class='diff-line-num'>{cur_old}</td><td class='diff-line-num'>{cur_new}</td><td class='diff-line-content'>{html.escape(l[1:])}</td></tr>")
+            elif c == ' ':
+                append(row_context % (cur_old, cur_new, escape(l[1:], False)))
                 cur_old += 1
                 cur_new += 1
             j += 1
@@ -1584,14 +1680,16 @@ class Render:
         start_line = hunk['new_start']
         end_line = hunk['new_start'] + hunk['new_count'] - 1
         scan_line = hunk['scan_line']
+        escape = html.escape
+        append = html_lines.append
         
-        html_lines.append(f"<tr class='diff-hunk-header'><td colspan='4'>@@ Scan Result Context: Lines {start_line}-{end_line} @@</td></tr>")
+        append(ROW_HUNK_HEADER % f"@@ Scan Result Context: Lines {start_line}-{end_line} @@")
         
         for ln in range(start_line, end_line + 1):
             content = full_lines[ln-1] if 0 <= ln-1 < len(full_lines) else ''
             
             # Always render the original line content first
-            html_lines.append(f"<tr class='diff-context'><td class='diff-sign'>&nbsp;</td><td class='diff-line-num'></td><td class='diff-line-num'>{ln}</td><td class='diff-line-content'>{html.escape(content)}</td></tr>")
+            append(ROW_NEW_CONTEXT % (ln, escape(content, False)))
             
             # Check if this line has a scan result and add it as an additional row
             scan_result = self._find_matching_scan_result(scan_results, filename, ln)
@@ -1606,26 +1704,56 @@ class Render:
                 # Get the count of issues
                 issue_count = scan_result.get('问题数量', 1)
                 count_text = f"({issue_count} issues)" if issue_count > 1 else ""
-                html_lines.append(f"<tr class='scan-result' id='{jump_id}'><td class='diff-sign'></td><td class='diff-line-num'></td><td class='diff-line-num'></td><td class='diff-line-content scan-result-content {severity_class}'><div class='scan-result-header'><span class='scan-result-cid {cid_class}'>{cid_number}</span><span>警告</span><span class='scan-result-count'>{count_text}</span></div><div class='scan-result-description'>{html.escape(scan_result['问题描述'])}</div><div class='scan-result-suggestion'>{html.escape(scan_result['修改意见'])}</div></td></tr>") 
+                append(f"<tr class='scan-result' id='{jump_id}'><td class='diff-sign'></td><td class='diff-line-num'></td><td class='diff-line-num'></td><td class='diff-line-content scan-result-content {severity_class}'><div class='scan-result-header'><span class='scan-result-cid {cid_class}'>{cid_number}</span><span>警告</span><span class='scan-result-count'>{count_text}</span></div><div class='scan-result-description'>{escape(scan_result['问题描述'])}</div><div class='scan-result-suggestion'>{escape(scan_result['修改意见'])}</div></td></tr>") 
     
-    def generate_review_page(self, commit_info, file_tree, scan_results, new_file_contents, diff_htmls):
+    def _write_file_content_sidecars(self, new_file_contents):
         """
-        Generate a review page HTML content.
+        Write each file's lines to a script under assets/files/ for on-demand loading.
+        
+        Sidecars are named by a digest of their content, so identical files
+        across commits share one sidecar and existing ones are not rewritten.
         
         Args:
-            commit_info (dict): Commit information including hash/revision, author, date, etc.
-            file_tree (dict): File tree structure
-            scan_results (list): List of scan results
             new_file_contents (dict): Dictionary of new file contents
-            diff_htmls (list): List of diff HTML content for each file
             
         Returns:
-            str: Complete HTML content for the review page
+            dict: Filename to sidecar digest, for files with content
         """
-        # Generate CSS and JS
-        self.generate_css()
-        self.generate_js()
+        files_dir = os.path.join(self.assets_dir, 'files')
+        os.makedirs(files_dir, exist_ok=True)
         
+        file_digests = {}
+        for filename, lines in new_file_contents.items():
+            if not lines:
+                continue
+            payload = json.dumps(lines, separators=(',', ':'))
+            digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+            file_digests[filename] = digest
+            
+            sidecar_path = os.path.join(files_dir, f"{digest}.js")
+            if os.path.exists(sidecar_path):
+                continue
+            # Write then rename, so parallel workers never expose a partial file
+            tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write("window.reviewFileContents = window.reviewFileContents || {};\n")
+                f.write(f'window.reviewFileContents["{digest}"] = {payload};\n')
+            os.replace(tmp_path, sidecar_path)
+        return file_digests
+    
+    def generate_review_page(self, out, commit_info, file_tree, scan_results, new_file_contents, diff_htmls):
+        """
+        Generate a review page, streaming the HTML to an open file.
+        
+        Args:
+            out (file): Writable text file the page is streamed to
+            commit_info (dict): Commit information including hash/revision, author, date, etc.
+            file_tree (dict): File tree structure
+            scan_results (list): List of scan results
+            new_file_contents (dict): Dictionary of new file contents
+            diff_htmls (iterable): Diff HTML content for each file; may be a
+                generator so only one file's diff is held in memory at a time
+        """
         # Determine if this is a Git commit or SVN revision
         is_svn = 'revision' in commit_info
         id_field = 'revision' if is_svn else 'hash'
@@ -1633,8 +1761,13 @@ class Render:
         info_class = 'revision-info' if is_svn else 'commit-info'
         message_class = 'revision-message' if is_svn else 'commit-message'
         
-        # Build HTML content
-        html_content = f'''<!DOCTYPE html>
+        # Fields shown more than once are escaped once
+        author_name = html.escape(commit_info['author_name'])
+        subject_html = self._convert_urls_to_links(commit_info['subject'])
+        
+        # Write HTML content
+        write = out.write
+        write(f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1644,11 +1777,11 @@ class Render:
 </head>
 <body>
     <div class="header">
-        <h1>{self._convert_urls_to_links(commit_info['subject'])}</h1>
+        <h1>{subject_html}</h1>
         <div class="{info_class}">
             <div class="{info_class}-item">
                 <div class="{info_class}-label">Author</div>
-                <div>{html.escape(commit_info['author_name'])} &lt;{html.escape(commit_info['author_email'])}&gt;</div>
+                <div>{author_name} &lt;{html.escape(commit_info['author_email'])}&gt;</div>
             </div>
             <div class="{info_class}-item">
                 <div class="{info_class}-label">{id_label}</div>
@@ -1662,8 +1795,8 @@ class Render:
         <div class="{message_class}">{html.escape(commit_info['body'])}</div>
     </div>
     <div class="header-fixed">
-        <div class="author-info">{html.escape(commit_info['author_name'])}=================</div>
-        <h1>{self._convert_urls_to_links(commit_info['subject'])}</h1>
+        <div class="author-info">{author_name}=================</div>
+        <h1>{subject_html}</h1>
     </div>
     <div class="review-main">
         <div class="file-list-panel">
@@ -1676,27 +1809,31 @@ class Render:
             {self.render_scan_results_panel(scan_results)}
         </div>
         <div class="diff-panel">
-'''
+''')
         # Add all diffs
         for i, diff_html in enumerate(diff_htmls):
-            html_content += f'''
+            write(f'''
             <div id="diff-{i}" class="diff-container">
                 {diff_html}
             </div>
-'''
-        # Embed new file contents as JSON for JS
-        html_content += f'''<script id="new-file-contents" type="application/json">{json.dumps(new_file_contents)}</script>'''
-        html_content += '''
+''')
+        # Embed only the filename -> sidecar digest index; "</" is escaped so a
+        # filename cannot close the tag early
+        file_digests = self._write_file_content_sidecars(new_file_contents)
+        file_digests_json = json.dumps(file_digests).replace('</', '<\\/')
+        write(f'''<script id="file-content-index" type="application/json">{file_digests_json}</script>''')
+        write('''
         </div>
     </div>
     <div class="footer">
-        Generated by ''' + ('SVN' if is_svn else 'Git') + ''' Review Generator
+        Generated by ''')
+        write('SVN' if is_svn else 'Git')
+        write(''' Review Generator
     </div>
     <script src="assets/script.js"></script>
 </body>
 </html>
-'''
-        return html_content
+''')
     
     def debug_path_matching(self, scan_results, svn_files):
         """
@@ -1725,4 +1862,4 @@ class Render:
             print(f"  Basename: {os.path.basename(svn_file)}")
             print()
         
-        print("================================\n") 
\ No newline at end of file
+        print("================================\n")
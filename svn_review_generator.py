@@ -14,8 +14,18 @@ import datetime
 import re
 import html
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from xml.etree import ElementTree as ET
-from render import Render
+from render import Render, escape_path
+
+# SVN path action letter to the status shown on review pages
+ACTION_MAP = {
+    'A': 'added',
+    'M': 'modified',
+    'D': 'deleted',
+    'R': 'renamed',
+}
 
 
 class SVNRevisionReviewGenerator:
@@ -41,6 +51,12 @@ class SVNRevisionReviewGenerator:
         self.template_dir = template_dir
         self.scan_results_dir = scan_results_dir
         
+        # Revision info already fetched during this run, keyed by revision
+        self._revision_info_cache = {}
+        
+        # (repository root URL, working copy root) of the working copy, fetched once
+        self._svn_info = None
+        
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
         
@@ -271,6 +287,21 @@ class SVNRevisionReviewGenerator:
             print(f"Error output: {e.stderr}")
             sys.exit(1)
     
+    def get_svn_info(self):
+        """
+        Get the repository root URL and working copy root of the working copy.
+        
+        Returns:
+            tuple: (repository root URL, working copy root path)
+        """
+        if self._svn_info is None:
+            info_output = self.run_svn_command(['info', '--xml'])
+            info_root = ET.fromstring(info_output)
+            repo_root = info_root.find('.//repository/root').text
+            working_copy_root = info_root.find('.//wcroot-abspath').text
+            self._svn_info = (repo_root, working_copy_root)
+        return self._svn_info
+    
     def get_revision_info(self, revision):
         """
         Get detailed information about a specific revision.
@@ -281,6 +312,10 @@ class SVNRevisionReviewGenerator:
         Returns:
             dict: Revision information
         """
+        cached = self._revision_info_cache.get(revision)
+        if cached is not None:
+            return cached
+        
         # Get revision info using svn log with XML output
         log_output = self.run_svn_command(['log', f'-r{revision}', '--xml', '-v'])
         
@@ -316,9 +351,11 @@ class SVNRevisionReviewGenerator:
                 'date': formatted_date,
                 'subject': msg.split('\n')[0] if msg else f'Revision {revision_num}',
                 'body': msg,
-                'files_changed': [],
+                # The -v log already lists the changed paths
+                'files_changed': self._parse_changed_paths(logentry),
             }
             
+            self._revision_info_cache[revision] = revision_info
             return revision_info
             
         except ET.ParseError as e:
@@ -335,52 +372,41 @@ class SVNRevisionReviewGenerator:
         Returns:
             list: List of changed files with their status
         """
-        # Get changed files using svn log with verbose flag
-        log_output = self.run_svn_command(['log', f'-r{revision}', '--xml', '-v'])
+        return self.get_revision_info(revision)['files_changed']
+    
+    def _parse_changed_paths(self, logentry):
+        """
+        Parse the changed paths of an `svn log -v --xml` log entry.
         
-        try:
-            root = ET.fromstring(log_output)
-            logentry = root.find('logentry')
-            
-            if logentry is None:
-                return []
-            
-            files = []
-            paths = logentry.find('paths')
-            if paths is not None:
-                for path in paths.findall('path'):
-                    action = path.get('action')
-                    filename = path.text
-                    
-                    # Remove leading slash and trunk/branches/tags prefix
-                    if filename.startswith('/'):
-                        filename = filename[1:]
-                    
-                    # Common SVN path prefixes to remove
-                    for prefix in ['trunk/', 'branches/main/', 'branches/master/']:
-                        if filename.startswith(prefix):
-                            filename = filename[len(prefix):]
-                            break
-                    
-                    action_map = {
-                        'A': 'added',
-                        'M': 'modified',
-                        'D': 'deleted',
-                        'R': 'renamed',
-                    }
-                    
-                    status_text = action_map.get(action, 'unknown')
-                    
-                    files.append({
-                        'status': status_text,
-                        'filename': filename
-                    })
-            
-            return files
+        Args:
+            logentry (Element): The logentry element
             
-        except ET.ParseError as e:
-            print(f"Error parsing SVN log XML: {e}")
-            return []
+        Returns:
+            list: List of changed files with their status
+        """
+        files = []
+        paths = logentry.find('paths')
+        if paths is not None:
+            for path in paths.findall('path'):
+                action = path.get('action')
+                filename = path.text
+                
+                # Remove leading slash and trunk/branches/tags prefix
+                if filename.startswith('/'):
+                    filename = filename[1:]
+                
+                # Common SVN path prefixes to remove
+                for prefix in ['trunk/', 'branches/main/', 'branches/master/']:
+                    if filename.startswith(prefix):
+                        filename = filename[len(prefix):]
+                        break
+                
+                files.append({
+                    'status': ACTION_MAP.get(action, 'unknown'),
+                    'filename': filename
+                })
+        
+        return files
     
     def get_file_diff(self, revision, filename):
         """
@@ -396,10 +422,7 @@ class SVNRevisionReviewGenerator:
         try:
             # For SVN, we need to construct the full path
             # First, let's get the repository root
-            info_output = self.run_svn_command(['info', '--xml'])
-            info_root = ET.fromstring(info_output)
-            repo_root = info_root.find('.//repository/root').text
-            working_copy_root = info_root.find('.//wcroot-abspath').text
+            repo_root, working_copy_root = self.get_svn_info()
             
             # Construct the URL for the file
             file_url = f"{repo_root}/trunk/{filename}"
@@ -439,9 +462,21 @@ class SVNRevisionReviewGenerator:
         
         generated_files = []
         
-        # Generate review page for each revision
-        for revision in revisions:
-            output_file = self.generate_review_page(revision)
+        # Shared assets are written once, not once per revision
+        self.renderer.generate_css()
+        self.renderer.generate_js()
+        
+        # Revisions are independent, so render them in parallel processes
+        if len(revisions) > 1:
+            worker_args = (self.repo_path, self.output_dir, None, self.template_dir, self.scan_results_dir)
+            max_workers = min(len(revisions), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_review_worker,
+                                     initargs=worker_args) as executor:
+                output_files = list(executor.map(_generate_review_page_in_worker, revisions))
+        else:
+            output_files = [self.generate_review_page(revision) for revision in revisions]
+        
+        for revision, output_file in zip(revisions, output_files):
             generated_files.append(output_file)
             print(f"Generated review page for revision {revision}: {output_file}")
         
@@ -507,6 +542,70 @@ class SVNRevisionReviewGenerator:
 
 
     
+    def _load_file_content(self, filename, working_copy_root):
+        """
+        Load the current content of a changed file from the working copy.
+        
+        Args:
+            filename (str): The changed file, relative to the repository root
+            working_copy_root (str): Root of the SVN working copy
+            
+        Returns:
+            tuple: Lines of the file, or an empty list if it cannot be read,
+                and the trace of where it was looked for, to be printed by the caller
+        """
+        # Runs in worker threads, so the trace is returned rather than printed
+        trace = [f"\nLoading content for: {filename}"]
+        file_path = None
+        try:
+            # Try to find the file in the working copy
+            # Handle the case where filename might have redundant path prefix
+            # e.g., if working_copy_root ends with 'src' and filename starts with 'src/'
+            potential_paths = []
+            
+            # Try the exact path
+            potential_paths.append(os.path.join(self.repo_path, filename))
+            
+            # Try stripping common prefixes if they match the end of working copy root
+            for prefix in ['src/', 'source/', 'code/', 'trunk/']:
+                if filename.startswith(prefix):
+                    stripped_filename = filename[len(prefix):]
+                    potential_paths.append(os.path.join(self.repo_path, stripped_filename))
+                    potential_paths.append(os.path.join(working_copy_root, stripped_filename))
+            
+            # Try with working copy root
+            potential_paths.append(os.path.join(working_copy_root, filename))
+            
+            # Try with trunk prefix
+            potential_paths.append(os.path.join(working_copy_root, 'trunk', filename))
+            
+            # Remove duplicates while preserving order
+            seen = set()
+            unique_paths = []
+            for path in potential_paths:
+                normalized_path = os.path.normpath(path)
+                if normalized_path not in seen:
+                    seen.add(normalized_path)
+                    unique_paths.append(path)
+            
+            for path in unique_paths:
+                trace.append(f"  Trying: {path} - {'EXISTS' if os.path.exists(path) else 'NOT FOUND'}")
+                if os.path.exists(path):
+                    file_path = path
+                    break
+            
+            if file_path and os.path.exists(file_path):
+                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                    content_lines = f.read().splitlines()
+                    trace.append(f"  SUCCESS: Loaded {len(content_lines)} lines from {file_path}")
+                return content_lines, trace
+            else:
+                trace.append(f"  FAILED: Could not find file {filename} in any location")
+                return [], trace
+        except Exception as e:
+            trace.append(f"  ERROR reading file {filename} from {file_path}: {str(e)}")
+            return [], trace
+    
     def generate_review_page(self, revision):
         """
         Generate a review page for a specific revision.
@@ -517,109 +616,69 @@ class SVNRevisionReviewGenerator:
         Returns:
             str: Path to the generated HTML file
         """
-        # Get revision information
+        # Get revision information, including the changed files
         revision_info = self.get_revision_info(revision)
         
-        # Get changed files
-        revision_info['files_changed'] = self.get_changed_files(revision)
-        
         # Build file tree
         file_tree = self.renderer._build_file_tree(revision_info['files_changed'])
         
         # Get repository root URL and working copy root
-        info_output = self.run_svn_command(['info', '--xml'])
-        info_root = ET.fromstring(info_output)
-        repo_root = info_root.find('.//repository/root').text
-        working_copy_root = info_root.find('.//wcroot-abspath').text
+        repo_root, working_copy_root = self.get_svn_info()
         
         # Preload new file contents for dynamic context
-        new_file_contents = {}
         print(f"\n===== LOADING FILE CONTENTS =====")
         print(f"Repository path: {self.repo_path}")
         print(f"Working copy root: {working_copy_root}")
         
-        for file_info in revision_info['files_changed']:
-            filename = file_info['filename']
-            print(f"\nLoading content for: {filename}")
-            try:
-                # Try to find the file in the working copy
-                # Handle the case where filename might have redundant path prefix
-                # e.g., if working_copy_root ends with 'src' and filename starts with 'src/'
-                potential_paths = []
-                
-                # Try the exact path
-                potential_paths.append(os.path.join(self.repo_path, filename))
-                
-                # Try stripping common prefixes if they match the end of working copy root
-                for prefix in ['src/', 'source/', 'code/', 'trunk/']:
-                    if filename.startswith(prefix):
-                        stripped_filename = filename[len(prefix):]
-                        potential_paths.append(os.path.join(self.repo_path, stripped_filename))
-                        potential_paths.append(os.path.join(working_copy_root, stripped_filename))
-                
-                # Try with working copy root
-                potential_paths.append(os.path.join(working_copy_root, filename))
-                
-                # Try with trunk prefix
-                potential_paths.append(os.path.join(working_copy_root, 'trunk', filename))
-                
-                # Remove duplicates while preserving order
-                seen = set()
-                unique_paths = []
-                for path in potential_paths:
-                    normalized_path = os.path.normpath(path)
-                    if normalized_path not in seen:
-                        seen.add(normalized_path)
-                        unique_paths.append(path)
-                
-                file_path = None
-                for path in unique_paths:
-                    print(f"  Trying: {path} - {'EXISTS' if os.path.exists(path) else 'NOT FOUND'}")
-                    if os.path.exists(path):
-                        file_path = path
-                        break
-                
-                if file_path and os.path.exists(file_path):
-                    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                        content_lines = f.read().splitlines()
-                        new_file_contents[filename] = content_lines
-                        print(f"  SUCCESS: Loaded {len(content_lines)} lines from {file_path}")
-                else:
-                    print(f"  FAILED: Could not find file {filename} in any location")
-                    new_file_contents[filename] = []
-            except Exception as e:
-                print(f"  ERROR reading file {filename} from {file_path}: {str(e)}")
-                new_file_contents[filename] = []
+        # Reads and per-file svn diff calls are independent and I/O bound,
+        # so overlap them in threads; deleted files get neither
+        filenames = [file_info['filename'] for file_info in revision_info['files_changed']
+                     if file_info['status'] != 'deleted']
+        with ThreadPoolExecutor(max_workers=min(16, len(filenames) or 1)) as executor:
+            contents = executor.map(lambda filename: self._load_file_content(filename, working_copy_root), filenames)
+            # Diffs are taken one at a time as the page is written, so each one
+            # can be freed once its file has been rendered. They are queued in
+            # file order rather than keyed by name, since stripping the trunk/ and
+            # branch prefixes can give two changed paths the same name
+            diff_futures = deque(executor.submit(self.get_file_diff, revision, filename)
+                                 for filename in filenames)
+            new_file_contents = {}
+            for filename, (content_lines, trace) in zip(filenames, contents):
+                # One block per file, so traces from different threads do not interleave
+                print('\n'.join(trace))
+                new_file_contents[filename] = content_lines
 
-        # Load scan results
-        scan_results = self.load_scan_results()
+            # Load scan results
+            scan_results = self.load_scan_results()
 
-        # Generate diff HTMLs for each file
-        diff_htmls = []
-        for i, file_info in enumerate(revision_info['files_changed']):
-            filename = file_info['filename']
-            diff_text = self.get_file_diff(revision, filename)
-            diff_html, _ = self.renderer.parse_diff_to_html_with_expand(diff_text, filename, i, scan_results, self.repo_path)
-            diff_htmls.append(f'''
-                <div class="diff-header">
-                    <div>{html.escape(filename)}</div>
-                </div>
-                {diff_html}
-            ''')
+            # Generate diff HTMLs for each file lazily, as the page is written
+            def iter_diff_htmls():
+                for i, file_info in enumerate(revision_info['files_changed']):
+                    filename = file_info['filename']
+                    if file_info['status'] == 'deleted':
+                        # Nothing is left to review line by line, so no svn diff is run for it
+                        diff_html = self.renderer.render_deleted_file()
+                    else:
+                        diff = diff_futures.popleft().result()
+                        diff_html, _ = self.renderer.parse_diff_to_html_with_expand(diff, filename, i, scan_results, self.repo_path)
+                    yield f'''
+                    <div class="diff-header">
+                        <div>{escape_path(filename)}</div>
+                    </div>
+                    {diff_html}
+                '''
 
-        # Generate HTML using common renderer
-        html_content = self.renderer.generate_review_page(
-            revision_info,
-            file_tree,
-            scan_results,
-            new_file_contents,
-            diff_htmls
-        )
-        
-        # Write HTML to file
-        output_file = os.path.join(self.output_dir, f"review-r{revision}.html")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            # Stream HTML to file using common renderer
+            output_file = os.path.join(self.output_dir, f"review-r{revision}.html")
+            with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                self.renderer.generate_review_page(
+                    f,
+                    revision_info,
+                    file_tree,
+                    scan_results,
+                    new_file_contents,
+                    iter_diff_htmls()
+                )
         return output_file
     
     def generate_index_page(self, revisions):
@@ -632,46 +691,13 @@ class SVNRevisionReviewGenerator:
         Returns:
             str: Path to the generated index HTML file
         """
-        html_content = """<!DOCTYPE html>
+        parts = ["""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>SVN Revision Reviews</title>
     <link rel="stylesheet" href="assets/style.css">
-    <style>
-        .revision-list {
-            background-color: #fff;
-            border: 1px solid #e1e4e8;
-            border-radius: 3px;
-            margin-bottom: 20px;
-        }
-        
-        .revision-item {
-            padding: 16px;
-            border-bottom: 1px solid #e1e4e8;
-        }
-        
-        .revision-item:last-child {
-            border-bottom: none;
-        }
-        
-        .revision-title {
-            font-weight: 600;
-            margin-bottom: 8px;
-        }
-        
-        .revision-meta {
-            color: #586069;
-            font-size: 12px;
-            display: flex;
-            flex-wrap: wrap;
-        }
-        
-        .revision-meta-item {
-            margin-right: 16px;
-        }
-    </style>
 </head>
 <body>
     <div class="header">
@@ -679,19 +705,20 @@ class SVNRevisionReviewGenerator:
     </div>
     
     <div class="revision-list">
-"""
+"""]
         
+        html_escape = html.escape
         for revision in revisions:
             revision_info = self.get_revision_info(revision)
             
-            html_content += f"""
+            parts.append(f"""
         <div class="revision-item">
             <div class="revision-title">
-                <a href="review-r{revision}.html">{html.escape(revision_info['subject'])}</a>
+                <a href="review-r{revision}.html">{html_escape(revision_info['subject'])}</a>
             </div>
             <div class="revision-meta">
                 <div class="revision-meta-item">
-                    <strong>Author:</strong> {html.escape(revision_info['author_name'])}
+                    <strong>Author:</strong> {html_escape(revision_info['author_name'])}
                 </div>
                 <div class="revision-meta-item">
                     <strong>Date:</strong> {revision_info['date']}
@@ -701,9 +728,9 @@ class SVNRevisionReviewGenerator:
                 </div>
             </div>
         </div>
-"""
+""")
         
-        html_content += """
+        parts.append("""
     </div>
     
     <div class="footer">
@@ -711,11 +738,24 @@ class SVNRevisionReviewGenerator:
     </div>
 </body>
 </html>
-"""
+""")
         
         # Write HTML to file
         output_file = os.path.join(self.output_dir, "index.html")
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write("".join(parts))
             
-        return output_file 
\ No newline at end of file
+        return output_file
+
+
+# Generator owned by each worker process of the review page pool
+_worker_generator = None
+
+def _init_review_worker(*generator_args):
+    """Create the per-process generator used by _generate_review_page_in_worker."""
+    global _worker_generator
+    _worker_generator = SVNRevisionReviewGenerator(*generator_args)
+
+def _generate_review_page_in_worker(revision):
+    """Generate one review page inside a worker process."""
+    return _worker_generator.generate_review_page(revision)